@@ -0,0 +1,215 @@
+"""Benchmark solver: membandingkan metode bagi dua dan mode solver lain pada sekumpulan soal.
+
+Untuk setiap soal (persamaan, interval, toleransi) dan setiap solver dicatat: jumlah iterasi
+(bagi dua), derajat polinom (Chebyshev), jumlah evaluasi f(x), waktu (wall time, termasuk parsing persamaan), dan error absolut terhadap
+akar referensi presisi tinggi (mpmath). Hasilnya ditampilkan sebagai tabel, bisa disimpan sebagai
+baseline (JSON), dan bisa dibandingkan dengan baseline untuk mendeteksi regresi.
+
+Contoh pemakaian:
+    python benchmark_solvers.py                                   # Tampilkan tabel perbandingan
+    python benchmark_solvers.py --save-baseline benchmark_baseline.json
+    python benchmark_solvers.py --compare benchmark_baseline.json # Exit code 1 jika ada regresi
+"""
+import argparse # Untuk argumen command line
+import json # Untuk menyimpan/membaca baseline
+import platform # Info mesin untuk metadata baseline
+import sys
+import time # Untuk mengukur wall time
+
+import mpmath # Aritmetika presisi tinggi untuk akar referensi
+import numpy
+import sympy
+
+from bisection_calculator import bisection_method, chebyshev_all_roots, parse_equation_for_lambdify, parse_equation_to_sympy, evaluate_numeric_input
+
+# Kumpulan soal: (nama, persamaan, a, b, toleransi). Setiap interval memuat tepat satu akar yang berubah tanda.
+PROBLEM_CORPUS = [
+    ("kubik_default", "x^3 + 4*x^2 - 10", "1", "1.5", "0.00001"), # Contoh bawaan GUI
+    ("kubik_presisi", "x^3 + 4*x^2 - 10", "1", "1.5", "10^-10"),
+    ("akar_dua", "x^2 - 2", "0", "2", "1e-8"),
+    ("cos_minus_x", "cos(x) - x", "0", "1", "1e-8"),
+    ("exp_minus_x", "exp(-x) - x", "0", "1", "1e-10"),
+    ("log_plus_x", "log(x) + x", "0.1", "1", "1e-8"),
+    ("sin_pi", "sin(x)", "3", "4", "1e-12"),
+    ("pangkat_10", "x^10 - 1", "0", "1.3", "1e-8"),
+    ("tan_minus_x", "tan(x) - x", "4", "4.6", "1e-8"),
+    ("akar_tripel", "(x-1)^3", "0", "2.5", "1e-6"),
+    ("exp_besar", "exp(x) - 1000", "0", "10", "1e-9"),
+    ("sqrt_minus_cos", "sqrt(x) - cos(x)", "0", "1", "1e-8"), # Turunan tak hingga di x = 0 (tidak mulus)
+]
+
+REFERENCE_DPS = 40 # Jumlah digit desimal untuk akar referensi
+
+class CountingFunction:
+    """Membungkus f(x) dan menghitung berapa kali f dievaluasi.
+    Untuk f tervektorisasi, satu panggilan dengan array dihitung sebanyak jumlah elemennya.
+    """
+    def __init__(self, f):
+        self.f = f
+        self.calls = 0
+
+    def __call__(self, x):
+        self.calls += numpy.size(x)
+        return self.f(x)
+
+def reference_root(equation_str, a_str, b_str):
+    """Menghitung akar referensi presisi tinggi di [a, b] dengan bagi dua mpmath.
+    Bagi dua dipakai (bukan solver interpolasi) agar akar ganda seperti (x-1)^3 tetap akurat.
+    """
+    x, expr = parse_equation_to_sympy(equation_str)
+    with mpmath.workdps(REFERENCE_DPS):
+        f_mp = sympy.lambdify(x, expr, modules="mpmath")
+        a, b = sorted((mpmath.mpf(a_str), mpmath.mpf(b_str)))
+        root = mpmath.findroot(f_mp, (a, b), solver="bisect", maxsteps=16 * REFERENCE_DPS) # ~3.3 langkah per digit ditambah lebar interval
+        if not a <= root <= b:
+            raise ValueError(f"Akar referensi untuk '{equation_str}' di [{a_str}, {b_str}] tidak ditemukan.")
+        return float(root)
+
+def run_bisection(equation_str, a_str, b_str, tol_str):
+    """Menjalankan bisection_method dan mengembalikan (akar, iterasi, derajat, evaluasi, pesan).
+    Akar diambil dari 'root_value' (float mentah), bukan 'root' yang sudah dibulatkan untuk tampilan.
+    """
+    counter = CountingFunction(parse_equation_for_lambdify(equation_str))
+    result = bisection_method(equation_str, a_str, b_str, tol_str, "200", f=counter)
+    if 'error' in result: return None, len(result.get('iterations_data', [])), None, counter.calls, result['error']
+    return result['root_value'], len(result['iterations_data']), None, counter.calls, result['message']
+
+def run_chebyshev(equation_str, a_str, b_str, tol_str):
+    """Menjalankan chebyshev_all_roots; tidak ada iterasi, yang dicatat derajat polinom Chebyshev efektif.
+    Evaluasi dihitung dari luar dengan CountingFunction (versi skalar dan vektor), sama seperti run_bisection.
+    """
+    counter = CountingFunction(parse_equation_for_lambdify(equation_str))
+    counter_vec = CountingFunction(parse_equation_for_lambdify(equation_str, vectorized=True))
+    result = chebyshev_all_roots(equation_str, a_str, b_str, tol_str, f=counter, f_vec=counter_vec)
+    evaluations = counter.calls + counter_vec.calls
+    if 'error' in result: return None, None, None, evaluations, result['error']
+    return result['root_values'], None, result['degree'], evaluations, result['message']
+
+# Solver yang dibandingkan: nama -> fungsi(persamaan, a, b, toleransi) -> (akar, iterasi, derajat, evaluasi, pesan).
+# Iterasi/derajat bernilai None jika tidak berlaku untuk solver tersebut.
+SOLVERS = {
+    "bisection": run_bisection,
+    "chebyshev": run_chebyshev,
+}
+
+def run_benchmark(solver_names, repeats=5, problems=PROBLEM_CORPUS):
+    """Menjalankan semua soal dengan semua solver. Wall time diambil dari waktu tercepat dari 'repeats' kali."""
+    references, results = {}, {}
+    for name, equation_str, a_str, b_str, tol_str in problems:
+        ref = reference_root(equation_str, a_str, b_str)
+        references[name] = ref
+        for solver_name in solver_names:
+            SOLVERS[solver_name](equation_str, a_str, b_str, tol_str) # Pemanasan (cache/import pertama) tidak ikut diukur
+            best_time = float('inf')
+            for _ in range(repeats):
+                started = time.perf_counter()
+                roots, iterations, degree, evaluations, message = SOLVERS[solver_name](equation_str, a_str, b_str, tol_str)
+                best_time = min(best_time, time.perf_counter() - started)
+            if roots is None:
+                abs_error = None
+            elif isinstance(roots, list): # Solver semua-akar: pakai akar yang paling dekat dengan referensi
+                abs_error = min((abs(r - ref) for r in roots), default=None)
+            else:
+                abs_error = abs(roots - ref)
+            results[f"{name}/{solver_name}"] = {
+                'problem': name, 'solver': solver_name, 'tolerance': evaluate_numeric_input(tol_str)[0],
+                'ok': abs_error is not None, 'iterations': iterations, 'degree': degree, 'evaluations': evaluations,
+                'time_ms': best_time * 1000, 'abs_error': abs_error, 'message': message,
+            }
+    return references, results
+
+def format_count(value):
+    """Angka hitungan untuk tabel; '-' jika tidak berlaku (None)."""
+    return "-" if value is None else str(value)
+
+def sum_counts(rows, key):
+    """Total satu kolom hitungan; None jika kolom itu tidak berlaku untuk semua baris."""
+    values = [r.get(key) for r in rows if r.get(key) is not None]
+    return sum(values) if values else None
+
+def format_table(results):
+    """Membuat tabel teks perbandingan per soal dan ringkasan total per solver.
+    Iterasi (bagi dua) dan derajat polinom (Chebyshev) ditampilkan di kolom terpisah karena satuannya berbeda.
+    """
+    header = f"{'Soal':<16} {'Solver':<10} {'Iter':>5} {'Derajat':>7} {'Eval':>6} {'Waktu(ms)':>10} {'Error Absolut':>14} {'Toleransi':>10}  Status"
+    lines = [header, "-" * len(header)]
+    for row in results.values():
+        err_txt = f"{row['abs_error']:.3e}" if row['abs_error'] is not None else "-"
+        if not row['ok']: status = "GAGAL"
+        elif row['abs_error'] <= row['tolerance']: status = "ok"
+        else: status = "error > ε"
+        lines.append(f"{row['problem']:<16} {row['solver']:<10} {format_count(row['iterations']):>5} {format_count(row.get('degree')):>7} {row['evaluations']:>6} "
+                     f"{row['time_ms']:>10.3f} {err_txt:>14} {row['tolerance']:>10.0e}  {status}")
+
+    lines.append("")
+    lines.append(f"{'Ringkasan':<16} {'Solver':<10} {'Iter':>5} {'Derajat':>7} {'Eval':>6} {'Waktu(ms)':>10} {'Gagal':>6}")
+    for solver_name in dict.fromkeys(row['solver'] for row in results.values()):
+        rows = [row for row in results.values() if row['solver'] == solver_name]
+        lines.append(f"{'total':<16} {solver_name:<10} {format_count(sum_counts(rows, 'iterations')):>5} {format_count(sum_counts(rows, 'degree')):>7} "
+                     f"{sum(r['evaluations'] for r in rows):>6} {sum(r['time_ms'] for r in rows):>10.3f} {sum(not r['ok'] for r in rows):>6}")
+    return "\n".join(lines)
+
+def compare_with_baseline(results, baseline, time_tolerance=0.5, time_floor_ms=1.0):
+    """Membandingkan hasil dengan baseline. Mengembalikan daftar pesan regresi (kosong jika tidak ada).
+    Iterasi, derajat, dan evaluasi bersifat deterministik sehingga kenaikan sekecil apa pun dihitung regresi;
+    waktu dianggap regresi jika lebih lambat dari (1 + time_tolerance) kali baseline dan selisihnya > time_floor_ms.
+    """
+    regressions = []
+    for key, base in baseline['results'].items():
+        row = results.get(key)
+        if row is None: continue # Soal/solver tidak dijalankan kali ini
+        if base['ok'] and not row['ok']:
+            regressions.append(f"{key}: sebelumnya berhasil, sekarang gagal ({row['message']})")
+            continue
+        if not row['ok']: continue
+        for field, label in (('iterations', "iterasi"), ('degree', "derajat")):
+            if row.get(field) is not None and base.get(field) is not None and row[field] > base[field]:
+                regressions.append(f"{key}: {label} naik {base[field]} -> {row[field]}")
+        if row['evaluations'] > base['evaluations']:
+            regressions.append(f"{key}: evaluasi f(x) naik {base['evaluations']} -> {row['evaluations']}")
+        if base['abs_error'] is not None and row['abs_error'] > max(10 * base['abs_error'], row['tolerance']):
+            regressions.append(f"{key}: error absolut memburuk {base['abs_error']:.3e} -> {row['abs_error']:.3e}")
+        if row['time_ms'] > base['time_ms'] * (1 + time_tolerance) and row['time_ms'] - base['time_ms'] > time_floor_ms:
+            regressions.append(f"{key}: waktu naik {base['time_ms']:.3f} ms -> {row['time_ms']:.3f} ms")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark solver akar: iterasi, evaluasi f(x), waktu, dan akurasi.")
+    parser.add_argument("--solvers", default=",".join(SOLVERS), help="Daftar solver dipisah koma (default: semua).")
+    parser.add_argument("--repeats", type=int, default=5, help="Jumlah pengulangan per soal; waktu tercepat yang dicatat.")
+    parser.add_argument("--save-baseline", metavar="FILE", help="Simpan hasil sebagai baseline JSON.")
+    parser.add_argument("--compare", metavar="FILE", help="Bandingkan dengan baseline JSON; exit code 1 jika ada regresi.")
+    parser.add_argument("--time-tolerance", type=float, default=0.5, help="Batas kenaikan waktu relatif sebelum dianggap regresi (default 0.5 = 50%%).")
+    args = parser.parse_args(argv)
+
+    solver_names = [s.strip() for s in args.solvers.split(",") if s.strip()]
+    unknown = [s for s in solver_names if s not in SOLVERS]
+    if unknown: parser.error(f"Solver tidak dikenal: {', '.join(unknown)}. Pilihan: {', '.join(SOLVERS)}")
+
+    references, results = run_benchmark(solver_names, repeats=max(args.repeats, 1))
+    print(format_table(results))
+
+    if args.save_baseline:
+        baseline = {
+            'meta': {'python': platform.python_version(), 'numpy': numpy.__version__, 'sympy': sympy.__version__,
+                     'machine': platform.machine(), 'repeats': args.repeats},
+            'references': references,
+            'results': results,
+        }
+        with open(args.save_baseline, "w", encoding="utf-8") as fh:
+            json.dump(baseline, fh, indent=2, ensure_ascii=False)
+        print(f"\nBaseline disimpan ke {args.save_baseline}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            baseline = json.load(fh)
+        regressions = compare_with_baseline(results, baseline, time_tolerance=args.time_tolerance)
+        if regressions:
+            print(f"\nRegresi terhadap {args.compare}:")
+            for msg in regressions: print(f"  - {msg}")
+            return 1
+        print(f"\nTidak ada regresi terhadap {args.compare}.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
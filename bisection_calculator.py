@@ -4,15 +4,27 @@ import sympy # libary untuk komputasi simbolik, berguna untuk parsing dan manipu
 from sympy.parsing.sympy_parser import parse_expr, standard_transformations, implicit_multiplication_application, convert_xor # Fungsi spesifik dari sympy untuk parsing
 import math # Modul matematika standar Python (untuk fungsi seperti exp, log, sqrt, dll. dalam kalkulasi numerik)
 import numpy # libarry untuk komputasi numerik, kadang dipakai oleh lambdify untuk fungsi tertentu
-import re # Modul regular expression, untuk pencarian pola teks (misalnya di format toleransi)
+import ast # Untuk mem-parsing ekspresi di kolom input numerik dengan aman (tanpa eval)
+import operator # Fungsi operator aritmetika untuk evaluator input numerik
+import time # Untuk mengukur batas waktu (deadline) perhitungan
+import threading # Untuk menjalankan perhitungan di background dan pembatalan (threading.Event)
+import multiprocessing # Untuk worker evaluasi f(x) yang bisa dihentikan paksa jika terlalu lama
+import asyncio # Untuk API perhitungan async
+import functools # Untuk functools.partial dan lru_cache (memoization)
 
 # Imports untuk Matplotlib Preview
 from matplotlib.figure import Figure # Untuk membuat area gambar (figure)
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg # Untuk mengintegrasikan Matplotlib dengan Tkinter
+
+# Imports untuk tab Grafik f(x)
+from matplotlib.backends.backend_tkagg import NavigationToolbar2Tk # Toolbar pan/zoom untuk plot
+from matplotlib.patches import Rectangle # Untuk menggambar bracket [a, b] pada animasi
 import io # Digunakan untuk menangani stream byte (tidak secara eksplisit dipakai di preview ini, tapi kadang berguna untuk image handling)
 
 # --- Backend Logic --- (Bagian logika inti kalkulator, tidak berhubungan langsung dengan tampilan)
 
+EPSILON_ZERO_CHECK = 1e-12 # Batas 'f(x) ≈ 0' yang dipakai bersama oleh bisection_method dan bisection_refine
+
 def to_superscript(text_val):
     """Mengubah angka biasa menjadi format superscript (pangkat atas).
     Misalnya, '2' jadi '²', '-' jadi '⁻'.
@@ -65,37 +77,46 @@ def format_float(value, precision=8):
     except (ValueError, TypeError): # Jika gagal diubah jadi float atau ada tipe yang salah
         return str(value) # Kembalikan sebagai string apa adanya
 
-def parse_equation_for_lambdify(equation_str):
+def parse_equation_to_sympy(equation_str):
+    """Mengurai string persamaan menjadi ekspresi Sympy (dengan 'x' sebagai satu-satunya variabel).
+    Mengembalikan tuple (simbol_x, ekspresi). Melempar ValueError/SyntaxError jika persamaan tidak valid.
+    Dipakai oleh parse_equation_for_lambdify dan oleh benchmark (untuk akar referensi presisi tinggi).
+    """
+    x = sympy.symbols('x') # Definisikan 'x' sebagai simbol matematika untuk Sympy
+    equation_str_processed = equation_str.lower().strip() # Ubah ke huruf kecil dan hapus spasi di awal/akhir
+    if not equation_str_processed: # Jika persamaannya kosong
+        raise ValueError("Persamaan tidak boleh kosong.")
+
+    # Transformasi standar untuk parser Sympy:
+    # - implicit_multiplication_application: biar '2x' diartikan '2*x'
+    # - convert_xor: biar '^' diartikan sebagai pangkat (bukan operator XOR bitwise)
+    transformations = standard_transformations + (implicit_multiplication_application, convert_xor)
+
+    # Kamus lokal untuk mendefinisikan fungsi dan konstanta yang diizinkan dalam persamaan
+    local_dict_sympy = {
+        'x': x, 'sin': sympy.sin, 'cos': sympy.cos, 'tan': sympy.tan,
+        'exp': sympy.exp, 'log': sympy.log, 'log10': lambda arg: sympy.log(arg, 10), # log basis 10
+        'sqrt': sympy.sqrt, 'abs': sympy.Abs, 'pi': sympy.pi, 'e': sympy.E, 'pow': sympy.Pow
+    }
+    # Proses parsing string persamaan menjadi ekspresi Sympy. 'evaluate=True' agar ekspresi disederhanakan jika memungkinkan.
+    parsed_expr = parse_expr(equation_str_processed, local_dict=local_dict_sympy, transformations=transformations, evaluate=True)
+    if parsed_expr is None: raise ValueError("Gagal mem-parsing ekspresi menjadi None.") # Jika parsing gagal total
+
+    # Cek apakah ada variabel lain selain 'x' di persamaan
+    free_symbols = parsed_expr.free_symbols # Dapatkan semua simbol bebas (variabel) dalam ekspresi
+    if free_symbols and (free_symbols - {x}): # Jika ada simbol bebas, dan simbol itu bukan 'x'
+        unknown_symbols = free_symbols - {x} # Cari simbol apa saja yang tidak dikenal
+        raise ValueError(f"Ditemukan variabel yang tidak dikenal: {', '.join(map(str, unknown_symbols))}. Hanya 'x' yang diizinkan.")
+    return x, parsed_expr
+
+def parse_equation_for_lambdify(equation_str, vectorized=False):
     """Mengurai (parse) string persamaan matematika menjadi fungsi Python yang bisa dihitung nilainya.
     Contoh: string "x^2 + 2*x" akan jadi fungsi f(x) = x*x + 2*x.
     Menggunakan Sympy untuk parsing dan lambdify.
+    Jika vectorized=True, fungsi yang dihasilkan memakai NumPy sehingga bisa menerima array x sekaligus.
     """
     try:
-        x = sympy.symbols('x') # Definisikan 'x' sebagai simbol matematika untuk Sympy
-        equation_str_processed = equation_str.lower().strip() # Ubah ke huruf kecil dan hapus spasi di awal/akhir
-        if not equation_str_processed: # Jika persamaannya kosong
-            raise ValueError("Persamaan tidak boleh kosong.")
-
-        # Transformasi standar untuk parser Sympy:
-        # - implicit_multiplication_application: biar '2x' diartikan '2*x'
-        # - convert_xor: biar '^' diartikan sebagai pangkat (bukan operator XOR bitwise)
-        transformations = standard_transformations + (implicit_multiplication_application, convert_xor)
-
-        # Kamus lokal untuk mendefinisikan fungsi dan konstanta yang diizinkan dalam persamaan
-        local_dict_sympy = {
-            'x': x, 'sin': sympy.sin, 'cos': sympy.cos, 'tan': sympy.tan,
-            'exp': sympy.exp, 'log': sympy.log, 'log10': lambda arg: sympy.log(arg, 10), # log basis 10
-            'sqrt': sympy.sqrt, 'abs': sympy.Abs, 'pi': sympy.pi, 'e': sympy.E, 'pow': sympy.Pow
-        }
-        # Proses parsing string persamaan menjadi ekspresi Sympy. 'evaluate=True' agar ekspresi disederhanakan jika memungkinkan.
-        parsed_expr = parse_expr(equation_str_processed, local_dict=local_dict_sympy, transformations=transformations, evaluate=True)
-        if parsed_expr is None: raise ValueError("Gagal mem-parsing ekspresi menjadi None.") # Jika parsing gagal total
-
-        # Cek apakah ada variabel lain selain 'x' di persamaan
-        free_symbols = parsed_expr.free_symbols # Dapatkan semua simbol bebas (variabel) dalam ekspresi
-        if free_symbols and (free_symbols - {x}): # Jika ada simbol bebas, dan simbol itu bukan 'x'
-            unknown_symbols = free_symbols - {x} # Cari simbol apa saja yang tidak dikenal
-            raise ValueError(f"Ditemukan variabel yang tidak dikenal: {', '.join(map(str, unknown_symbols))}. Hanya 'x' yang diizinkan.")
+        x, parsed_expr = parse_equation_to_sympy(equation_str) # Parsing dan validasi variabel
 
         # Modul yang akan digunakan oleh 'lambdify' untuk evaluasi numerik.
         # Ini memberitahu lambdify untuk menggunakan fungsi dari 'math' atau 'numpy' saat menghitung.
@@ -104,16 +125,22 @@ def parse_equation_for_lambdify(equation_str):
              'sin': math.sin, 'cos': math.cos, 'tan': math.tan,
              'sqrt': math.sqrt, 'abs': abs, 'pi': math.pi, 'e': math.e, 'pow': pow}, "numpy"
         ]
+        if vectorized: # Versi vektor: semua fungsi diambil dari NumPy agar bisa menerima array
+            numerical_modules = ["numpy"]
         try:
             # Ubah ekspresi Sympy ('parsed_expr') menjadi fungsi Python biasa yang siap pakai.
             # Fungsi ini akan menerima satu argumen (nilai x) dan mengembalikan hasil perhitungan.
             func = sympy.lambdify(x, parsed_expr, modules=numerical_modules)
             try:
-                _ = func(1.0) # Tes fungsi dengan nilai dummy (misal 1.0) untuk memastikan ia bekerja
+                _ = func(numpy.array([1.0]) if vectorized else 1.0) # Tes fungsi dengan nilai dummy (misal 1.0) untuk memastikan ia bekerja
+                if vectorized and parsed_expr.is_constant(): raise TypeError("konstanta") # Konstanta tidak menghasilkan array, tangani di bawah
             except TypeError as te: # Tangkap error jika ekspresi ternyata adalah konstanta (misal "5" atau "pi")
                 if parsed_expr.is_constant(): # Jika memang konstanta
                     const_val = float(parsed_expr.evalf()) # Evaluasi nilai konstanta tersebut
-                    func = lambda val: const_val # Buat fungsi lambda yang selalu mengembalikan nilai konstanta itu
+                    if vectorized: # Versi vektor harus mengembalikan array dengan bentuk yang sama dengan x
+                        func = lambda val: numpy.full(numpy.shape(val), const_val)
+                    else:
+                        func = lambda val: const_val # Buat fungsi lambda yang selalu mengembalikan nilai konstanta itu
                 else: # Jika error lain, bukan karena konstanta
                     raise ValueError(f"Ekspresi '{equation_str}' tidak bisa diubah menjadi fungsi dari x. Detail: {te}")
             return func # Kembalikan fungsi yang sudah jadi
@@ -179,10 +206,106 @@ def get_latex_from_equation(equation_str):
     except Exception: # Tangkap error tak terduga lainnya
         return r"\text{Error pratinjau}"
 
-def bisection_method(equation_str, a_str, b_str, tol_str, max_iter_str="100"):
+# Nama dan fungsi yang boleh dipakai di kolom input numerik (a, b, toleransi, maks iterasi)
+MAX_NUMERIC_INPUT_LENGTH = 200 # Batas panjang input, dicek sebelum parsing agar ekspresi raksasa tidak menghabiskan stack/memori
+NUMERIC_INPUT_CONSTANTS = {'pi': math.pi, 'e': math.e}
+NUMERIC_INPUT_FUNCTIONS = {
+    'sqrt': math.sqrt, 'exp': math.exp, 'log': math.log, 'log10': math.log10,
+    'sin': math.sin, 'cos': math.cos, 'tan': math.tan, 'abs': abs,
+}
+# Operator biner: kelas AST -> (fungsi, simbol tampilan, prioritas)
+NUMERIC_INPUT_BINARY_OPS = {
+    ast.Add: (operator.add, "+", 1), ast.Sub: (operator.sub, "-", 1),
+    ast.Mult: (operator.mul, "*", 2), ast.Div: (operator.truediv, "/", 2),
+    ast.Pow: (operator.pow, "^", 4),
+}
+
+def evaluate_numeric_node(node, source):
+    """Menghitung satu node AST ekspresi numerik secara rekursif.
+    Mengembalikan tuple (nilai, tampilan, prioritas); prioritas dipakai untuk menentukan perlu tidaknya kurung di tampilan.
+    """
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float): # bool dan complex tidak diizinkan
+        return float(node.value), ast.get_source_segment(source, node), 5 # Tampilkan angka persis seperti diketik (misal "1e-3")
+    if isinstance(node, ast.Name):
+        if node.id not in NUMERIC_INPUT_CONSTANTS: raise ValueError(f"Nama tidak dikenal: '{node.id}'. Konstanta yang diizinkan: pi, e.")
+        return NUMERIC_INPUT_CONSTANTS[node.id], node.id, 5
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+        value, display, prec = evaluate_numeric_node(node.operand, source)
+        sign = "-" if isinstance(node.op, ast.USub) else "+"
+        if prec < 3: display = f"({display})"
+        return (-value if sign == "-" else value), sign + display, 3
+    if isinstance(node, ast.BinOp) and type(node.op) in NUMERIC_INPUT_BINARY_OPS:
+        func, symbol, prec = NUMERIC_INPUT_BINARY_OPS[type(node.op)]
+        left_val, left_disp, left_prec = evaluate_numeric_node(node.left, source)
+        right_val, right_disp, right_prec = evaluate_numeric_node(node.right, source)
+        value = func(left_val, right_val)
+        if isinstance(value, complex): # Misal (-8)^(1/3); jangan sampai diubah jadi real oleh abs() di luarnya
+            raise ValueError(f"Bagian '{ast.get_source_segment(source, node).replace('**', '^')}' menghasilkan bilangan kompleks.")
+        if symbol == "^":
+            if left_prec <= prec: left_disp = f"({left_disp})" # Pangkat bersifat asosiatif kanan
+            if all(ch in "0123456789-." for ch in right_disp): # Eksponen angka sederhana ditulis sebagai superscript
+                return value, left_disp + to_superscript(right_disp), prec
+            return value, f"{left_disp}^({right_disp})" if right_prec < prec else f"{left_disp}^{right_disp}", prec
+        if left_prec < prec: left_disp = f"({left_disp})"
+        if right_prec < prec or (right_prec == prec and symbol in "-/"): right_disp = f"({right_disp})"
+        return value, f"{left_disp}{symbol}{right_disp}", prec
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in NUMERIC_INPUT_FUNCTIONS:
+        if len(node.args) != 1 or node.keywords: raise ValueError(f"Fungsi '{node.func.id}' hanya menerima satu argumen.")
+        arg_val, arg_disp, _ = evaluate_numeric_node(node.args[0], source)
+        value = NUMERIC_INPUT_FUNCTIONS[node.func.id](arg_val)
+        if isinstance(value, complex): raise ValueError(f"Bagian '{ast.get_source_segment(source, node).replace('**', '^')}' menghasilkan bilangan kompleks.")
+        return float(value), f"{node.func.id}({arg_disp})", 5
+    raise ValueError(f"Bagian ekspresi tidak didukung: '{ast.get_source_segment(source, node) or type(node).__name__}'.")
+
+@functools.lru_cache(maxsize=4096)
+def evaluate_numeric_input(text):
+    """Menghitung nilai kolom input numerik (a, b, toleransi, maks iterasi) dengan aman lewat AST, tanpa eval.
+    Mendukung angka (termasuk notasi 1e-5), + - * / ^ **, kurung, konstanta pi dan e, serta fungsi
+    sqrt, exp, log, log10, sin, cos, tan, abs. Contoh: "10^-5", "pi/2", "1e-3*2".
+    Hasil di-memoize per string, jadi input yang sama (misal ribuan baris batch) hanya di-parse sekali.
+    Mengembalikan tuple (nilai_float, tampilan), misal "10^-5" -> (1e-05, "10⁻⁵"). Melempar ValueError jika tidak valid
+    (termasuk input lebih dari MAX_NUMERIC_INPUT_LENGTH karakter, ekspresi terlalu bersarang, atau hasil kompleks).
+    """
+    if isinstance(text, (int, float)) and not isinstance(text, bool): # Sudah berupa angka (misal dari kode lain)
+        if not math.isfinite(text): raise ValueError(f"Nilai '{text}' bukan bilangan real hingga.")
+        return float(text), format_float(text)
+    source = str(text).strip().lower().replace("^", "**") # '^' ditulis pengguna sebagai pangkat, bukan XOR
+    if not source: raise ValueError("Input tidak boleh kosong.")
+    if len(source) > MAX_NUMERIC_INPUT_LENGTH: raise ValueError(f"Input terlalu panjang (maksimal {MAX_NUMERIC_INPUT_LENGTH} karakter).")
+    try:
+        tree = ast.parse(source, mode="eval")
+    except SyntaxError:
+        raise ValueError(f"Sintaks tidak valid: '{text}'.")
+    except (RecursionError, MemoryError): # Kurung/operator bersarang terlalu dalam
+        raise ValueError("Ekspresi terlalu bersarang/kompleks.")
+    try:
+        value, display, _ = evaluate_numeric_node(tree.body, source)
+    except (RecursionError, MemoryError):
+        raise ValueError("Ekspresi terlalu bersarang/kompleks.")
+    except OverflowError:
+        raise ValueError(f"Hasil ekspresi '{text}' terlalu besar.")
+    except (ZeroDivisionError, TypeError) as e: # TypeError: misal fungsi math yang menerima bilangan kompleks
+        raise ValueError(f"Ekspresi '{text}' tidak bisa dihitung: {e}")
+    except ValueError as e:
+        if "math domain" in str(e): raise ValueError(f"Ekspresi '{text}' di luar domain fungsi (misal sqrt/log dari bilangan negatif).")
+        raise
+    if not math.isfinite(value): raise ValueError(f"Hasil ekspresi '{text}' bukan bilangan real hingga.")
+    return value, display
+
+def format_numeric_input_for_log(display, value, precision=8):
+    """Tampilan input numerik untuk log: ekspresi yang diketik plus nilai hasil hitungnya jika berbeda."""
+    value_str = format_float(value, precision)
+    return value_str if display == value_str else f"{display} (dihitung sebagai: {value_str})"
+
+def bisection_method(equation_str, a_str, b_str, tol_str, max_iter_str="100", f=None, should_cancel=None):
     """Fungsi inti yang menjalankan algoritma metode bagi dua.
     Menerima string persamaan, interval awal [a,b], toleransi, dan maks iterasi.
-    Mengembalikan dictionary berisi akar, data iterasi, pesan, dll.
+    Mengembalikan dictionary berisi akar ('root' terformat untuk tampilan, 'root_value' berupa float mentah),
+    data iterasi (string terformat untuk tabel, dan 'iteration_values' berisi nilai mentah (n, a, b, c, f(c))
+    per iterasi), pesan, dll.
+    Opsional: 'f' adalah fungsi f(x) yang sudah jadi (misal EvaluationWorker), dan 'should_cancel'
+    adalah fungsi tanpa argumen yang dicek di awal setiap iterasi; jika True, perhitungan dihentikan
+    dan hasil sementara (data iterasi sejauh ini) dikembalikan dengan 'cancelled': True.
     """
     iteration_log_text = [] # List untuk menyimpan log teks setiap langkah iterasi
     value_precision = 8 # Presisi angka untuk nilai a, b, c, f(x) di log dan tabel
@@ -191,50 +314,37 @@ def bisection_method(equation_str, a_str, b_str, tol_str, max_iter_str="100"):
     tol = 0.0 # Inisialisasi nilai toleransi (akan diisi dari input)
     try:
         # 1. Parse persamaan string menjadi fungsi f(x) yang bisa dievaluasi
-        f = parse_equation_for_lambdify(equation_str)
+        if f is None: f = parse_equation_for_lambdify(equation_str)
 
         # 2. Konversi input string a, b, toleransi, max_iter menjadi tipe numerik (float/int)
-        a = float(a_str); b = float(b_str) # Ubah string a dan b ke float
+        #    Semua kolom memakai evaluate_numeric_input, jadi bisa berupa ekspresi seperti "pi/2" atau "10^-5".
+        try:
+            a, a_display = evaluate_numeric_input(a_str); b, b_display = evaluate_numeric_input(b_str)
+        except ValueError as e_ab:
+            return {'error': f"Format interval a/b tidak valid.\nDetail: {str(e_ab)}"}
         if a == b: return {'error': "Interval a dan b tidak boleh sama."} # Validasi a dan b
         if a > b: # Jika a > b, tukar nilainya agar a selalu lebih kecil dari b
-            a, b = b, a
+            a, b, a_display, b_display = b, a, b_display, a_display
             iteration_log_text.append("Info: Nilai a dan b ditukar karena a > b.\n")
 
         try:
-            # Evaluasi string toleransi dengan aman. Ini memungkinkan input seperti "10^-5" atau "0.1/2".
-            tol_val_str_eval = tol_str.replace(" ", "") # Hapus spasi
-            # Ganti format pangkat 'x^y' atau 'x^(y)' menjadi 'x**y' yang bisa dievaluasi Python
-            tol_val_str_eval = re.sub(r'(\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)\s*\^\s*\(?\s*(-?\d+(?:\.\d+)?)\s*\)?', r'\1**\2', tol_val_str_eval)
-            tol_val_str_eval = re.sub(r'(\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)\s*\^\s*(-?\d+(?:\.\d+)?)', r'\1**\2', tol_val_str_eval) # Versi tanpa kurung untuk eksponen
-
-            # Hanya izinkan operasi matematika dasar (+, -, *, /, **) dan konstanta dari modul 'math' (e, pi)
-            # Ini untuk keamanan, agar tidak sembarang kode Python bisa dieksekusi dari input toleransi.
-            if any(op in tol_val_str_eval for op in ['**', '/', '*', '+', '-']):
-                 tol = float(eval(tol_val_str_eval, {"__builtins__": None}, {"math": math, "e": math.e, "pi": math.pi}))
-            else: # Jika hanya angka biasa
-                 tol = float(tol_val_str_eval)
-
+            tol, tol_display = evaluate_numeric_input(tol_str) # Evaluasi string toleransi (misal "10^-5" atau "0.1/2")
             if tol <= 0: return {'error': "Toleransi error (ε) harus lebih besar dari nol."} # Validasi toleransi
-        except Exception as e_tol: # Jika ada error saat evaluasi string toleransi
+        except ValueError as e_tol: # Jika ada error saat evaluasi string toleransi
             return {'error': f"Format toleransi tidak valid: '{tol_str}'.\nDetail: {str(e_tol)}"}
 
-        max_iter = int(max_iter_str) # Ubah string max_iter ke integer
+        try:
+            max_iter_val, _ = evaluate_numeric_input(max_iter_str)
+        except ValueError as e_iter:
+            return {'error': f"Format maksimum iterasi tidak valid: '{max_iter_str}'.\nDetail: {str(e_iter)}"}
+        if not max_iter_val.is_integer(): return {'error': "Maksimum iterasi harus bilangan bulat."}
+        max_iter = int(max_iter_val) # Ubah ke integer
         if max_iter <=0: return {'error': "Maksimum iterasi harus lebih besar dari nol."} # Validasi max_iter
     except ValueError as e: return {'error': str(e)} # Error jika konversi tipe gagal (misal input bukan angka)
     except Exception as e: return {'error': f"Input tidak valid: {str(e)}."} # Error umum lainnya dari persiapan input
 
-    # Format tampilan toleransi untuk log, bisa jadi pakai superscript jika inputnya pakai '^' atau '**'
-    display_tol_for_log = format_float(tol, error_precision) # Tampilan default
-    original_tol_input = tol_str.strip()
-    # Cek apakah format toleransi input menggunakan ^ atau **
-    match_caret = re.match(r"^\s*([\d\.]+|[eE]|[pP][iI])\s*\^\s*\(?\s*([-\d\.]+)\s*\)?\s*$", original_tol_input)
-    match_star = re.match(r"^\s*([\d\.]+|[eE]|[pP][iI])\s*\*\*\s*\(?\s*([-\d\.]+)\s*\)?\s*$", original_tol_input)
-    if match_caret: # Jika pakai '^'
-        base, exp = match_caret.groups()
-        display_tol_for_log = f"{base}{to_superscript(exp)} (dihitung sebagai: {format_float(tol, error_precision)})"
-    elif match_star: # Jika pakai '**'
-        base, exp = match_star.groups()
-        display_tol_for_log = f"{base}{to_superscript(exp)} (dihitung sebagai: {format_float(tol, error_precision)})"
+    # Format tampilan toleransi untuk log, pakai superscript jika inputnya pakai '^' atau '**' (misal "10⁻⁵")
+    display_tol_for_log = format_numeric_input_for_log(tol_display, tol, error_precision)
 
     # 3. Hitung f(a) dan f(b) awal
     try:
@@ -243,31 +353,36 @@ def bisection_method(equation_str, a_str, b_str, tol_str, max_iter_str="100"):
         return {'error': f"Error saat menghitung f(x) pada interval awal: {str(e_eval)}.\nCek persamaan atau interval."}
 
 
-    epsilon_zero_check = 1e-12 # Angka yang sangat kecil untuk perbandingan dengan nol (mengatasi isu presisi float)
+    epsilon_zero_check = EPSILON_ZERO_CHECK # Angka yang sangat kecil untuk perbandingan dengan nol (mengatasi isu presisi float)
 
     # 4. Cek kondisi awal metode biseksi
     #    a. Jika f(a) atau f(b) sudah sangat dekat dengan nol, berarti a atau b adalah akarnya.
     if abs(f_a_initial) < epsilon_zero_check:
         iteration_log_text.append(f"Data Awal:\n  f(a) = f({format_float(a, value_precision)}) = {format_float(f_a_initial, value_precision)} ≈ 0. Titik 'a' adalah akar.\n")
-        return {'root': format_float(a, value_precision), 'iterations_data': [], 'message': f"Akar ditemukan pada x = {format_float(a, value_precision)} (f(a) ≈ 0).", 'final_absolute_error': 0.0, 'tolerance': tol, 'iteration_log_text': iteration_log_text}
+        return {'root': format_float(a, value_precision), 'root_value': a, 'iterations_data': [], 'iteration_values': [], 'message': f"Akar ditemukan pada x = {format_float(a, value_precision)} (f(a) ≈ 0).", 'final_absolute_error': 0.0, 'tolerance': tol, 'iteration_log_text': iteration_log_text}
     if abs(f_b_initial) < epsilon_zero_check:
         iteration_log_text.append(f"Data Awal:\n  f(b) = f({format_float(b, value_precision)}) = {format_float(f_b_initial, value_precision)} ≈ 0. Titik 'b' adalah akar.\n")
-        return {'root': format_float(b, value_precision), 'iterations_data': [], 'message': f"Akar ditemukan pada x = {format_float(b, value_precision)} (f(b) ≈ 0).", 'final_absolute_error': 0.0, 'tolerance': tol, 'iteration_log_text': iteration_log_text}
+        return {'root': format_float(b, value_precision), 'root_value': b, 'iterations_data': [], 'iteration_values': [], 'message': f"Akar ditemukan pada x = {format_float(b, value_precision)} (f(b) ≈ 0).", 'final_absolute_error': 0.0, 'tolerance': tol, 'iteration_log_text': iteration_log_text}
 
     #    b. Syarat utama: f(a) dan f(b) harus berbeda tanda (f(a) * f(b) < 0)
     if f_a_initial * f_b_initial > 0:
         return {'error': f"f(a) & f(b) tidak beda tanda. f({format_float(a,value_precision)})={format_float(f_a_initial,value_precision)}, f({format_float(b,value_precision)})={format_float(f_b_initial,value_precision)}."}
 
     iterations_data = [] # List untuk menyimpan data per iterasi (untuk tabel)
+    iteration_values = [] # Nilai mentah (n, a, b, c, f(c)) per iterasi, tanpa pembulatan tampilan (untuk animasi grafik)
     c_prev_iter = None   # c dari iterasi sebelumnya, untuk hitung error absolut. Awalnya None.
 
     # Log data awal sebelum iterasi dimulai
-    iteration_log_text.append(f"Data Awal:\n  Persamaan f(x) = {equation_str}\n  Interval awal: [{format_float(a, value_precision)}, {format_float(b, value_precision)}]\n  Toleransi (ε): {display_tol_for_log}\n  f(a) = f({format_float(a, value_precision)}) = {format_float(f_a_initial, value_precision)}\n  f(b) = f({format_float(b, value_precision)}) = {format_float(f_b_initial, value_precision)}\n  Kondisi awal terpenuhi (f(a) * f(b) < 0).\n")
+    iteration_log_text.append(f"Data Awal:\n  Persamaan f(x) = {equation_str}\n  Interval awal: [{format_numeric_input_for_log(a_display, a, value_precision)}, {format_numeric_input_for_log(b_display, b, value_precision)}]\n  Toleransi (ε): {display_tol_for_log}\n  f(a) = f({format_float(a, value_precision)}) = {format_float(f_a_initial, value_precision)}\n  f(b) = f({format_float(b, value_precision)}) = {format_float(f_b_initial, value_precision)}\n  Kondisi awal terpenuhi (f(a) * f(b) < 0).\n")
 
     c = a # Inisialisasi c (misal dengan a), dipakai jika max_iter = 0 atau sangat kecil.
 
     # 5. Loop Iterasi Utama
     for n in range(1, max_iter + 1): # Loop dari 1 sampai max_iter
+        # Pembatalan kooperatif: dicek di antara iterasi, hasil sementara tetap dikembalikan
+        if should_cancel is not None and should_cancel():
+            iteration_log_text.append(f"\n\n\nDibatalkan sebelum iterasi ke-{n}.")
+            return {'error': f"Perhitungan dibatalkan setelah {n-1} iterasi.", 'cancelled': True, 'root': format_float(c, value_precision) if iterations_data else None, 'root_value': c if iterations_data else None, 'iterations_data': iterations_data, 'iteration_values': iteration_values, 'tolerance': tol, 'iteration_log_text': iteration_log_text}
         # Bagian log untuk header setiap iterasi
         log_parts = [f"\n\n\n====== Iterasi ke-{n} ======"] # Ini akan diberi gaya khusus di GUI
         log_parts.append(f"  Interval saat ini [{format_float(a, value_precision)},{format_float(b, value_precision)}]: a = {format_float(a, value_precision)}, b = {format_float(b, value_precision)}")
@@ -276,21 +391,27 @@ def bisection_method(equation_str, a_str, b_str, tol_str, max_iter_str="100"):
         except Exception as e_eval_iter: # Tangkap error jika evaluasi f(x) gagal di tengah iterasi
             iteration_log_text.append("\n".join(log_parts)) # Tambahkan log yang sudah ada
             iteration_log_text.append(f"  Error saat menghitung f(x) di iterasi {n}: {str(e_eval_iter)}")
-            return {'error': f"Error evaluasi f(x) pada iterasi {n}: {str(e_eval_iter)}", 'iteration_log_text': iteration_log_text, 'iterations_data':iterations_data}
+            return {'error': f"Error evaluasi f(x) pada iterasi {n}: {str(e_eval_iter)}", 'iteration_log_text': iteration_log_text, 'iterations_data':iterations_data, 'iteration_values':iteration_values}
 
         log_parts.extend([f"  f(a) = {format_float(f_a_curr, value_precision)}", f"  f(b) = {format_float(f_b_curr, value_precision)}"])
 
         # Kondisi berhenti tambahan: jika interval [a,b] sudah sangat kecil
         if abs(b-a) < epsilon_zero_check:
             c = (a+b)/2 # Aproksimasi c sebagai tengah interval
+            try:
+                f_c = f(c)
+            except Exception as e_eval_fc: # Sama seperti f(c) di loop utama (termasuk timeout/pembatalan worker)
+                iteration_log_text.append("\n".join(log_parts))
+                iteration_log_text.append(f"  Error saat menghitung f(c) di iterasi {n}: {str(e_eval_fc)}")
+                return {'error': f"Error evaluasi f(c) pada iterasi {n}: {str(e_eval_fc)}", 'iteration_log_text': iteration_log_text, 'iterations_data':iterations_data, 'iteration_values':iteration_values}
             abs_err = abs(c - c_prev_iter) if c_prev_iter is not None else 0.0 # Hitung error absolut jika memungkinkan
             log_parts.append(f"  Interval [a,b] sudah sangat kecil ({format_float(abs(b-a), error_precision)}). Aproksimasi c = {format_float(c, value_precision)}. Hentikan.")
             # Siapkan data untuk tabel ringkasan
-            tbl_info = {"n":n,"a":format_float(a,value_precision),"f(a)":format_float(f_a_curr,value_precision),"b":format_float(b,value_precision),"f(b)":format_float(f_b_curr,value_precision),"c":format_float(c,value_precision),"f(c)":format_float(f(c),value_precision),"Abs_Error":format_float(abs_err,error_precision),"Rel_Error_Percent":"-","Update":"Interval sgt kecil"}
-            iterations_data.append(tbl_info)
+            tbl_info = {"n":n,"a":format_float(a,value_precision),"f(a)":format_float(f_a_curr,value_precision),"b":format_float(b,value_precision),"f(b)":format_float(f_b_curr,value_precision),"c":format_float(c,value_precision),"f(c)":format_float(f_c,value_precision),"Abs_Error":format_float(abs_err,error_precision),"Rel_Error_Percent":"-","Update":"Interval sgt kecil"}
+            iterations_data.append(tbl_info); iteration_values.append((n, a, b, c, f_c))
             iteration_log_text.append("\n".join(log_parts))
             # Kembalikan hasil
-            return {'root':format_float(c,value_precision),'iterations_data':iterations_data,'message':f"Interval sgt kecil. Aproksimasi x={format_float(c,value_precision)} ({n} iter).",'final_absolute_error':abs_err,'tolerance':tol,'iteration_log_text':iteration_log_text}
+            return {'root':format_float(c,value_precision),'root_value':c,'iterations_data':iterations_data,'iteration_values':iteration_values,'message':f"Interval sgt kecil. Aproksimasi x={format_float(c,value_precision)} ({n} iter).",'final_absolute_error':abs_err,'tolerance':tol,'iteration_log_text':iteration_log_text}
 
         #   a. Hitung titik tengah c = (a+b)/2
         c_calc = (a + b) / 2
@@ -307,11 +428,17 @@ def bisection_method(equation_str, a_str, b_str, tol_str, max_iter_str="100"):
         # Ini mencegah loop tak hingga jika interval tidak bisa dibagi lebih kecil lagi.
         if c == a or c == b:
             abs_err = abs(c - c_prev_iter) if c_prev_iter is not None else 0.0
+            try:
+                f_c = f(c)
+            except Exception as e_eval_fc: # Sama seperti f(c) di loop utama (termasuk timeout/pembatalan worker)
+                iteration_log_text.append("\n".join(log_parts))
+                iteration_log_text.append(f"  Error saat menghitung f(c) di iterasi {n}: {str(e_eval_fc)}")
+                return {'error': f"Error evaluasi f(c) pada iterasi {n}: {str(e_eval_fc)}", 'iteration_log_text': iteration_log_text, 'iterations_data':iterations_data, 'iteration_values':iteration_values}
             log_parts.append(f"  Titik tengah c ({format_float(c,value_precision)}) sama dengan a atau b. Batas presisi tercapai.")
-            tbl_info = {"n":n,"a":format_float(a,value_precision),"f(a)":format_float(f_a_curr,value_precision),"b":format_float(b,value_precision),"f(b)":format_float(f_b_curr,value_precision),"c":format_float(c,value_precision),"f(c)":format_float(f(c),value_precision),"Abs_Error":format_float(abs_err,error_precision),"Rel_Error_Percent":"-","Update":"Presisi tercapai"}
-            iterations_data.append(tbl_info)
+            tbl_info = {"n":n,"a":format_float(a,value_precision),"f(a)":format_float(f_a_curr,value_precision),"b":format_float(b,value_precision),"f(b)":format_float(f_b_curr,value_precision),"c":format_float(c,value_precision),"f(c)":format_float(f_c,value_precision),"Abs_Error":format_float(abs_err,error_precision),"Rel_Error_Percent":"-","Update":"Presisi tercapai"}
+            iterations_data.append(tbl_info); iteration_values.append((n, a, b, c, f_c))
             iteration_log_text.append("\n".join(log_parts))
-            return {'root':format_float(c,value_precision),'iterations_data':iterations_data,'message':f"Batas presisi. Aproksimasi x={format_float(c,value_precision)} ({n} iter).",'final_absolute_error':abs_err,'tolerance':tol,'iteration_log_text':iteration_log_text}
+            return {'root':format_float(c,value_precision),'root_value':c,'iterations_data':iterations_data,'iteration_values':iteration_values,'message':f"Batas presisi. Aproksimasi x={format_float(c,value_precision)} ({n} iter).",'final_absolute_error':abs_err,'tolerance':tol,'iteration_log_text':iteration_log_text}
 
         #   b. Hitung f(c)
         try:
@@ -319,7 +446,7 @@ def bisection_method(equation_str, a_str, b_str, tol_str, max_iter_str="100"):
         except Exception as e_eval_fc: # Tangkap error jika evaluasi f(c) gagal
             iteration_log_text.append("\n".join(log_parts))
             iteration_log_text.append(f"  Error saat menghitung f(c) di iterasi {n}: {str(e_eval_fc)}")
-            return {'error': f"Error evaluasi f(c) pada iterasi {n}: {str(e_eval_fc)}", 'iteration_log_text': iteration_log_text, 'iterations_data':iterations_data}
+            return {'error': f"Error evaluasi f(c) pada iterasi {n}: {str(e_eval_fc)}", 'iteration_log_text': iteration_log_text, 'iterations_data':iterations_data, 'iteration_values':iteration_values}
         log_parts.append(f"  f({c_lbl}) = f({format_float(c, value_precision)}) = {format_float(f_c, value_precision)}")
 
         abs_err, rel_err_pct = None, None # Inisialisasi variabel error
@@ -347,9 +474,9 @@ def bisection_method(equation_str, a_str, b_str, tol_str, max_iter_str="100"):
             upd_txt = "Akar ditemukan (f(c) ≈ 0)!"
             log_parts.append(f"  Status: {upd_txt} (f(c) = {format_float(f_c, error_precision)})") # Tampilkan f(c) dengan presisi lebih tinggi
             tbl_info["Update"] = upd_txt
-            iterations_data.append(tbl_info)
+            iterations_data.append(tbl_info); iteration_values.append((n, a, b, c, f_c))
             iteration_log_text.append("\n".join(log_parts))
-            return {'root':format_float(c,value_precision),'iterations_data':iterations_data,'message':f"Akar x={format_float(c,value_precision)} ({n} iter, f(c)≈0).",'final_absolute_error':abs_err if abs_err is not None else 0.0,'tolerance':tol,'iteration_log_text':iteration_log_text}
+            return {'root':format_float(c,value_precision),'root_value':c,'iterations_data':iterations_data,'iteration_values':iteration_values,'message':f"Akar x={format_float(c,value_precision)} ({n} iter, f(c)≈0).",'final_absolute_error':abs_err if abs_err is not None else 0.0,'tolerance':tol,'iteration_log_text':iteration_log_text}
 
         #   e. Update interval [a,b] untuk iterasi selanjutnya
         prod_fa_fc, prod_fc_fb = f_a_curr * f_c, f_c * f_b_curr # f(a)*f(c) dan f(c)*f(b)
@@ -366,12 +493,13 @@ def bisection_method(equation_str, a_str, b_str, tol_str, max_iter_str="100"):
             upd_txt = "Err: Interval?"
             log_parts.append(f"  Peringatan: Problem interval. f(a)={format_float(f_a_curr,value_precision)}, f(b)={format_float(f_b_curr,value_precision)}, f(c)={format_float(f_c,value_precision)}")
             tbl_info["Update"] = upd_txt
-            iterations_data.append(tbl_info)
+            iterations_data.append(tbl_info); iteration_values.append((n, a, b, c, f_c))
             iteration_log_text.append("\n".join(log_parts))
             # Kembalikan error jika ada masalah dengan update interval (sangat jarang terjadi)
             return {'error':f"Problem interval iter {n}. f(a)f(c)={prod_fa_fc:.2e}, f(c)f(b)={prod_fc_fb:.2e}",'iteration_log_text':iteration_log_text}
 
         log_parts.append(f"  Update: {upd_txt}. Interval baru: [{format_float(a_new,value_precision)}, {format_float(b_new,value_precision)}]")
+        iteration_values.append((n, a, b, c, f_c)) # Nilai mentah interval sebelum di-update (sama dengan baris tabel)
         a,b = a_new,b_new # Perbarui nilai a dan b untuk iterasi berikutnya
         tbl_info["Update"] = upd_txt
         iterations_data.append(tbl_info) # Simpan data iterasi ini
@@ -382,14 +510,435 @@ def bisection_method(equation_str, a_str, b_str, tol_str, max_iter_str="100"):
         #   f. Cek kondisi berhenti: Jika error absolut < toleransi (ε)
         if abs_err is not None and abs_err < tol:
             iteration_log_text.append(f"\n\n\nKonvergensi: Error Absolut ({format_float(abs_err,error_precision)}) < Toleransi Error ({format_float(tol,error_precision)})")
-            return {'root':format_float(c,value_precision),'iterations_data':iterations_data,'message':f"Konvergen x={format_float(c,value_precision)} (Iterasi Ke-{n}).",'final_absolute_error':abs_err,'tolerance':tol,'iteration_log_text':iteration_log_text}
+            return {'root':format_float(c,value_precision),'root_value':c,'iterations_data':iterations_data,'iteration_values':iteration_values,'message':f"Konvergen x={format_float(c,value_precision)} (Iterasi Ke-{n}).",'final_absolute_error':abs_err,'tolerance':tol,'iteration_log_text':iteration_log_text}
 
         c_prev_iter = c_prev_iter_for_next # Update c_prev_iter untuk iterasi selanjutnya
 
     # 6. Jika loop selesai karena max_iter tercapai (bukan karena kondisi berhenti lain)
     final_err = abs_err if abs_err is not None else 0.0 # Error terakhir yang dihitung
     iteration_log_text.append(f"\nPeringatan:\n  Maksimum iterasi ({max_iter}) tercapai.")
-    return {'root':format_float(c,value_precision),'iterations_data':iterations_data,'message':f"Maks iter ({max_iter}). Aproksimasi x={format_float(c,value_precision)}.",'final_absolute_error':final_err,'tolerance':tol,'iteration_log_text':iteration_log_text}
+    return {'root':format_float(c,value_precision),'root_value':c,'iterations_data':iterations_data,'iteration_values':iteration_values,'message':f"Maks iter ({max_iter}). Aproksimasi x={format_float(c,value_precision)}.",'final_absolute_error':final_err,'tolerance':tol,'iteration_log_text':iteration_log_text}
+
+def bisection_refine(f, a, b, tol, max_iter=60, accept_endpoints=True):
+    """Menjalankan langkah-langkah bagi dua (tanpa log) pada bracket [a,b] sampai setengah lebar interval < tol.
+    Dipakai untuk memoles akar hasil metode lain (misal Chebyshev), yang bisa memanggilnya puluhan kali per persamaan.
+    Sengaja dipisah dari bisection_method: versi itu memformat baris tabel dan log setiap iterasi serta
+    menghitung ulang f(a) dan f(b) tiap langkah, sedangkan di sini hanya f(c) yang dievaluasi.
+    Aturan berhenti (EPSILON_ZERO_CHECK, interval sangat kecil, batas presisi float) disamakan dengan bisection_method.
+    Jika accept_endpoints=False, a dan b hanyalah titik bantu bracket (bukan kandidat akar), jadi ujung yang
+    f-nya ≈ 0 tidak dikembalikan sebagai akar; bracket itu dianggap tidak valid.
+    Mengembalikan tuple (akar, jumlah_langkah, jumlah_evaluasi), atau None jika f(a) dan f(b) tidak beda tanda.
+    """
+    epsilon_zero_check = EPSILON_ZERO_CHECK
+    f_a, f_b = f(a), f(b); evaluations = 2
+    if abs(f_a) < epsilon_zero_check or abs(f_b) < epsilon_zero_check:
+        if not accept_endpoints: return None # Ujung bracket buatan, bukan akar yang dicari
+        return (a if abs(f_a) < epsilon_zero_check else b), 0, evaluations # Ujung bracket sudah akar
+    if f_a * f_b > 0: return None # Tidak ada perubahan tanda, bracket tidak valid
+
+    steps = 0
+    while steps < max_iter and abs(b - a) / 2 >= tol:
+        c = (a + b) / 2
+        if abs(b - a) < epsilon_zero_check or c == a or c == b: break # Interval sangat kecil / batas presisi float tercapai
+        f_c = f(c); evaluations += 1; steps += 1
+        if abs(f_c) < epsilon_zero_check: return c, steps, evaluations # Akar ditemukan (f(c) ≈ 0)
+        if f_a * f_c < 0: b, f_b = c, f_c # Akar di [a,c]
+        else: a, f_a = c, f_c # Akar di [c,b]
+    return (a + b) / 2, steps, evaluations
+
+def chebyshev_coefficients(values):
+    """Menghitung koefisien deret Chebyshev dari nilai fungsi di titik Chebyshev jenis kedua.
+    Nilai harus berurutan untuk t_k = cos(pi*k/n), k = 0..n (dari t = 1 ke t = -1). Memakai FFT (DCT-I).
+    """
+    n = len(values) - 1
+    if n == 0: return numpy.array(values, dtype=float) # Hanya satu titik: polinom konstan
+    extended = numpy.concatenate([values, values[n-1:0:-1]]) # Perluasan genap agar bisa dipakai FFT
+    coeffs = numpy.real(numpy.fft.fft(extended))[:n+1] / n
+    coeffs[0] /= 2; coeffs[n] /= 2 # Koefisien ujung dibagi dua (aturan DCT-I)
+    return coeffs
+
+def chebyshev_colleague_roots(coeffs):
+    """Mencari semua akar (kompleks) dari deret Chebyshev sum(c_k * T_k(t)) lewat nilai eigen colleague matrix."""
+    degree = len(coeffs) - 1
+    if degree < 1: return numpy.array([]) # Polinom konstan tidak punya akar
+    if degree == 1: return numpy.array([-coeffs[0] / coeffs[1]]) # Polinom linear: c0 + c1*t = 0
+    # Baris ke-k merepresentasikan t*T_k = (T_{k-1} + T_{k+1}) / 2, dengan t*T_0 = T_1.
+    colleague = numpy.zeros((degree, degree))
+    colleague[0, 1] = 1.0
+    idx = numpy.arange(1, degree - 1)
+    colleague[idx, idx - 1] = 0.5; colleague[idx, idx + 1] = 0.5
+    colleague[degree-1, degree-2] = 0.5
+    # T_n pada baris terakhir diganti dengan -(c_0*T_0 + ... + c_{n-1}*T_{n-1}) / c_n
+    colleague[degree-1, :] -= coeffs[:degree] / (2 * coeffs[degree])
+    return numpy.linalg.eigvals(colleague)
+
+def chebyshev_all_roots(equation_str, a_str, b_str, tol_str="1e-10", max_degree=512, should_cancel=None, f=None, f_vec=None):
+    """Mencari SEMUA akar f(x) = 0 di interval [a,b] sekaligus dengan proxy Chebyshev.
+    f dievaluasi (tervektorisasi) di titik Chebyshev, derajat digandakan sampai koefisien meluruh,
+    lalu akar diambil dari nilai eigen colleague matrix dan dipoles dengan beberapa langkah bagi dua.
+    Cocok untuk fungsi mulus; mengembalikan dictionary berisi daftar akar, pesan, log, dll.
+    'should_cancel' (opsional) sama seperti di bisection_method: dicek di antara penggandaan derajat
+    dan di antara pemolesan kandidat akar; jika True, hasil dikembalikan dengan 'cancelled': True.
+    'f' (skalar) dan 'f_vec' (menerima array NumPy) opsional, seperti 'f' di bisection_method; jika None, di-parse dari persamaan.
+    """
+    iteration_log_text = [] # Log teks proses pencarian akar
+    value_precision = 8 # Presisi angka untuk nilai x dan f(x)
+    error_precision = 10 # Presisi angka untuk toleransi
+
+    try:
+        if f_vec is None: f_vec = parse_equation_for_lambdify(equation_str, vectorized=True) # Versi NumPy, untuk sampling titik Chebyshev
+        if f is None: f = parse_equation_for_lambdify(equation_str) # Versi skalar, untuk pemolesan dengan bagi dua
+        try:
+            a, _ = evaluate_numeric_input(a_str); b, _ = evaluate_numeric_input(b_str)
+        except ValueError as e_ab:
+            return {'error': f"Format interval a/b tidak valid.\nDetail: {str(e_ab)}"}
+        if a == b: return {'error': "Interval a dan b tidak boleh sama."}
+        if a > b: # Samakan dengan bisection_method: pastikan a < b
+            a, b = b, a
+            iteration_log_text.append("Info: Nilai a dan b ditukar karena a > b.\n")
+        try:
+            tol, tol_display = evaluate_numeric_input(tol_str)
+            if tol <= 0: return {'error': "Toleransi error (ε) harus lebih besar dari nol."}
+        except ValueError as e_tol:
+            return {'error': f"Format toleransi tidak valid: '{tol_str}'.\nDetail: {str(e_tol)}"}
+    except ValueError as e: return {'error': str(e)}
+    except Exception as e: return {'error': f"Input tidak valid: {str(e)}."}
+
+    iteration_log_text.append(f"Data Awal:\n  Persamaan f(x) = {equation_str}\n  Interval: [{format_float(a, value_precision)}, {format_float(b, value_precision)}]\n  Toleransi (ε): {format_numeric_input_for_log(tol_display, tol, error_precision)}\n  Metode: proxy Chebyshev + colleague matrix, dipoles dengan bagi dua.\n")
+
+    mid, half_width = (a + b) / 2, (b - a) / 2 # Pemetaan t ∈ [-1,1] -> x ∈ [a,b]
+    n = 16 # Derajat awal
+    t = numpy.cos(numpy.pi * numpy.arange(n + 1) / n)
+    try:
+        with numpy.errstate(all='ignore'): # NaN/inf dicek manual di bawah
+            values = numpy.asarray(f_vec(mid + half_width * t), dtype=float)
+        evaluations = n + 1
+
+        # 1. Naikkan derajat sampai koefisien Chebyshev meluruh (atau max_degree tercapai)
+        while True:
+            if not numpy.all(numpy.isfinite(values)):
+                return {'error': "f(x) tidak terdefinisi (NaN/inf) di sebagian titik pada [a, b].\nMetode Chebyshev butuh fungsi yang mulus di seluruh interval.", 'iteration_log_text': iteration_log_text}
+            coeffs = chebyshev_coefficients(values)
+            scale = numpy.max(numpy.abs(coeffs))
+            if scale == 0:
+                return {'error': "f(x) identik nol di [a, b]; akar tidak terisolasi.", 'iteration_log_text': iteration_log_text}
+            cutoff = 1e-13 * scale # Koefisien di bawah ini dianggap noise floating point
+            converged = numpy.all(numpy.abs(coeffs[-3:]) <= cutoff)
+            iteration_log_text.append(f"\n  Derajat {n}: |koefisien ekor| = {numpy.max(numpy.abs(coeffs[-3:])):.2e} ({'meluruh' if converged else 'belum meluruh'})")
+            if converged or n >= max_degree: break
+            if should_cancel is not None and should_cancel():
+                iteration_log_text.append(f"\n\n\nDibatalkan pada derajat {n}.")
+                return {'error': f"Perhitungan dibatalkan pada derajat {n}.", 'cancelled': True, 'iteration_log_text': iteration_log_text}
+            # Titik lama adalah titik genap pada grid 2n, jadi cukup evaluasi titik ganjil yang baru (satu panggilan vektor)
+            t_new = numpy.cos(numpy.pi * numpy.arange(1, 2 * n, 2) / (2 * n))
+            with numpy.errstate(all='ignore'):
+                new_values = numpy.asarray(f_vec(mid + half_width * t_new), dtype=float)
+            merged = numpy.empty(2 * n + 1)
+            merged[0::2] = values; merged[1::2] = new_values
+            values = merged; evaluations += n; n *= 2
+    except Exception as e_eval:
+        return {'error': f"Error saat menghitung f(x) di titik Chebyshev: {str(e_eval)}.", 'iteration_log_text': iteration_log_text}
+
+    if not converged:
+        iteration_log_text.append(f"\n  Peringatan: koefisien belum meluruh pada derajat maksimum ({max_degree}). Fungsi mungkin tidak mulus; akar bisa kurang akurat.")
+
+    # 2. Buang koefisien ekor yang sudah di bawah noise, lalu cari akar lewat colleague matrix
+    degree = int(numpy.nonzero(numpy.abs(coeffs) > cutoff)[0][-1])
+    coeffs = coeffs[:degree + 1]
+    iteration_log_text.append(f"\n  Derajat efektif setelah dipangkas: {degree}")
+    eig = chebyshev_colleague_roots(coeffs)
+    real_mask = (numpy.abs(eig.imag) < 1e-8) & (numpy.abs(eig.real) <= 1 + 1e-8) # Hanya akar real di dalam [-1,1]
+    candidates = numpy.sort(mid + half_width * numpy.clip(eig.real[real_mask], -1.0, 1.0))
+    merge_gap = 1e-8 * (b - a) # Kandidat yang hampir sama (akar ganda) digabung
+    unique_candidates = []
+    for x_cand in candidates:
+        if not unique_candidates or x_cand - unique_candidates[-1] > merge_gap:
+            unique_candidates.append(float(x_cand))
+
+    # 3. Poles setiap kandidat dengan bracket kecil dan beberapa langkah bagi dua (kecuali f(kandidat) sudah ≈ 0)
+    roots = []
+    scalar_evaluations = 0
+    def f_counted(x): # Semua evaluasi skalar (kandidat, bracket gagal, langkah bagi dua) dihitung di satu tempat
+        nonlocal scalar_evaluations
+        scalar_evaluations += 1
+        return f(x)
+    polish_half_width = 1e-6 * (b - a)
+    f_threshold = 1e-8 * scale # Batas |f(x)| untuk menerima akar tanpa perubahan tanda (akar ganda/sentuh)
+    for i, x_cand in enumerate(unique_candidates):
+        if should_cancel is not None and should_cancel():
+            iteration_log_text.append(f"\n\n\nDibatalkan setelah {len(roots)} akar dipoles.")
+            return {'error': f"Perhitungan dibatalkan setelah {len(roots)} dari {len(unique_candidates)} kandidat akar dipoles.", 'cancelled': True, 'iteration_log_text': iteration_log_text}
+        max_h = b - a # Batas lebar bracket: jangan sampai menabrak akar tetangga
+        if i > 0: max_h = min(max_h, (x_cand - unique_candidates[i-1]) / 2)
+        if i < len(unique_candidates) - 1: max_h = min(max_h, (unique_candidates[i+1] - x_cand) / 2)
+        h = min(polish_half_width, max_h)
+        try:
+            f_cand = f_counted(x_cand)
+            if abs(f_cand) < EPSILON_ZERO_CHECK: # Kandidat sudah akar; memoles bracket di sekitarnya hanya menggesernya (akar ganda)
+                roots.append(x_cand)
+                iteration_log_text.append(f"\n  Akar ke-{len(roots)}: x = {format_float(x_cand, value_precision)} (f(x) ≈ 0 di kandidat, tanpa pemolesan)")
+                continue
+            refined = None
+            for _ in range(6): # Perlebar bracket (x10) jika kandidat kurang akurat sehingga belum ada perubahan tanda
+                lo, hi = max(a, x_cand - h), min(b, x_cand + h)
+                refined = bisection_refine(f_counted, lo, hi, tol, accept_endpoints=False) if hi > lo else None
+                if refined is not None or h >= max_h: break
+                h = min(h * 10, max_h)
+            if refined is not None:
+                root, steps, _ = refined
+                roots.append(root)
+                iteration_log_text.append(f"\n  Akar ke-{len(roots)}: x = {format_float(root, value_precision)} (dipoles {steps} langkah bagi dua)")
+            elif abs(f_cand) <= f_threshold: # Tidak ada perubahan tanda tapi f ≈ 0, kemungkinan akar ganda
+                roots.append(x_cand)
+                iteration_log_text.append(f"\n  Akar ke-{len(roots)}: x = {format_float(x_cand, value_precision)} (tanpa perubahan tanda, kemungkinan akar ganda)")
+        except Exception as e_eval:
+            iteration_log_text.append(f"\n  Kandidat x = {format_float(x_cand, value_precision)} dilewati: {str(e_eval)}")
+
+    evaluations += scalar_evaluations
+    if roots:
+        message = f"{len(roots)} akar ditemukan di [{format_float(a, value_precision)}, {format_float(b, value_precision)}] (derajat {degree}, {evaluations} evaluasi f(x))."
+    else:
+        message = f"Tidak ada akar di [{format_float(a, value_precision)}, {format_float(b, value_precision)}] (derajat {degree}, {evaluations} evaluasi f(x))."
+    iteration_log_text.append(f"\n\n\n{message}")
+    return {'roots': [format_float(r, value_precision) for r in roots], 'root_values': roots, 'degree': degree, 'function_evaluations': evaluations, 'message': message, 'tolerance': tol, 'iteration_log_text': iteration_log_text}
+
+@functools.lru_cache(maxsize=32)
+def get_vectorized_function(equation_str):
+    """Versi ter-cache dari parse_equation_for_lambdify(..., vectorized=True),
+    agar sampling ulang saat pan/zoom plot tidak perlu mem-parsing persamaan lagi.
+    """
+    return parse_equation_for_lambdify(equation_str, vectorized=True)
+
+@functools.lru_cache(maxsize=32)
+def sample_function_for_plot(equation_str, x_min, x_max, pixel_width, pixel_height=300, oversample=4):
+    """Mengambil sampel f(x) di [x_min, x_max] untuk digambar, sudah didesimasi sesuai lebar plot (pixel).
+    f dievaluasi dengan satu panggilan NumPy di pixel_width*oversample titik, lalu setiap kolom pixel
+    cukup diwakili titik min dan max-nya (atau satu titik saja jika variasinya < 1 pixel vertikal),
+    sehingga lonjakan tetap terlihat tapi jumlah titik yang digambar tetap kecil.
+    Hasil di-cache per (persamaan, interval, ukuran); mengembalikan tuple (xs, ys) yang read-only.
+    """
+    f_vec = get_vectorized_function(equation_str)
+    n_cols = max(int(pixel_width), 2)
+    xs = numpy.linspace(x_min, x_max, n_cols * oversample)
+    with numpy.errstate(all='ignore'):
+        ys = numpy.array(f_vec(xs), dtype=float) # Bisa gagal untuk nilai kompleks; ditangani pemanggil
+    ys[~numpy.isfinite(ys)] = numpy.nan # Titik tak terdefinisi digambar sebagai celah
+
+    finite_ys = ys[numpy.isfinite(ys)]
+    if finite_ys.size == 0: return xs[:0], ys[:0] # Tidak ada titik yang bisa digambar
+
+    # Desimasi min/max per kolom pixel (urutan x tetap dijaga)
+    xs_cols, ys_cols = xs.reshape(n_cols, oversample), ys.reshape(n_cols, oversample)
+    idx_min = numpy.argmin(numpy.where(numpy.isnan(ys_cols), numpy.inf, ys_cols), axis=1)
+    idx_max = numpy.argmax(numpy.where(numpy.isnan(ys_cols), -numpy.inf, ys_cols), axis=1)
+    first, second = numpy.minimum(idx_min, idx_max), numpy.maximum(idx_min, idx_max)
+    rows = numpy.arange(n_cols)
+    y_pixel = (numpy.max(finite_ys) - numpy.min(finite_ys)) / max(int(pixel_height), 1) # Tinggi satu pixel dalam satuan y
+    with numpy.errstate(invalid='ignore'):
+        flat_cols = numpy.abs(ys_cols[rows, second] - ys_cols[rows, first]) <= y_pixel # Kolom datar: satu titik cukup
+    keep = numpy.stack([numpy.ones(n_cols, dtype=bool), ~flat_cols], axis=1).ravel()
+    xs_out = numpy.stack([xs_cols[rows, first], xs_cols[rows, second]], axis=1).ravel()[keep]
+    ys_out = numpy.stack([ys_cols[rows, first], ys_cols[rows, second]], axis=1).ravel()[keep]
+    xs_out.flags.writeable = False; ys_out.flags.writeable = False # Array dibagi lewat cache, jangan diubah
+    return xs_out, ys_out
+
+class EvaluationTimeoutError(Exception):
+    """Dilempar jika satu evaluasi f(x) melebihi batas waktu (worker sudah dihentikan paksa)."""
+
+class EvaluationCancelledError(Exception):
+    """Dilempar jika evaluasi f(x) yang sedang berjalan dibatalkan oleh pengguna/deadline."""
+
+def evaluation_worker_main(conn):
+    """Loop utama proses worker evaluasi f(x).
+    Pesan masuk: ('load', equation_str) atau ('eval', x); None untuk berhenti.
+    Balasan: ('ok', nilai) atau ('err', pesan_error).
+    """
+    f = None
+    while True:
+        try:
+            msg = conn.recv()
+        except EOFError: # Proses induk sudah menutup pipe
+            break
+        if msg is None: break
+        kind, payload = msg
+        try:
+            if kind == 'load':
+                f = parse_equation_for_lambdify(payload)
+                conn.send(('ok', None))
+            else:
+                conn.send(('ok', f(payload)))
+        except Exception as e:
+            conn.send(('err', str(e)))
+
+class EvaluationWorker:
+    """Mengevaluasi f(x) di proses terpisah agar evaluasi yang terlalu lama bisa dihentikan paksa.
+    Objek ini bisa dipanggil seperti fungsi f(x), jadi bisa langsung diberikan ke bisection_method(f=...).
+    Proses worker dipakai ulang antar perhitungan dan baru dibuat lagi setelah dihentikan paksa;
+    persamaan terakhir yang di-load otomatis dimuat ulang ke proses baru sebelum evaluasi berikutnya.
+    Satu worker hanya melayani satu perhitungan pada satu waktu: jangan membagi worker yang sama
+    ke beberapa thread/task async yang berjalan bersamaan (pesan di pipe akan tertukar).
+    """
+    poll_interval = 0.05 # Detik; seberapa sering pembatalan dicek selama menunggu hasil evaluasi
+
+    def __init__(self, eval_timeout=None):
+        self.eval_timeout = eval_timeout # Batas waktu satu evaluasi (detik), None = tanpa batas
+        self.should_cancel = None # Fungsi tanpa argumen; jika True, evaluasi yang sedang ditunggu dibatalkan
+        self.process = None
+        self.conn = None
+        self.equation = None # Persamaan yang diminta lewat load(), tetap diingat setelah worker dihentikan paksa
+        self.loaded_equation = None # Persamaan yang sudah di-parse di proses worker yang sedang berjalan
+        self.interrupted = None # 'timed_out' atau 'cancelled' jika evaluasi terakhir dihentikan paksa
+
+    def start(self):
+        """Menjalankan proses worker jika belum berjalan."""
+        if self.process is not None and self.process.is_alive(): return
+        ctx = multiprocessing.get_context("spawn") # 'spawn' aman dipakai dari aplikasi GUI yang punya banyak thread
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=evaluation_worker_main, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.loaded_equation = None
+
+    def kill(self):
+        """Menghentikan paksa proses worker (dipakai saat timeout atau pembatalan)."""
+        if self.process is not None and self.process.pid is not None: # pid None = proses gagal dijalankan
+            self.process.kill(); self.process.join()
+        if self.conn is not None: self.conn.close()
+        self.process, self.conn, self.loaded_equation = None, None, None
+
+    def close(self):
+        """Menghentikan proses worker secara normal."""
+        if self.process is not None and self.process.is_alive():
+            try:
+                self.conn.send(None)
+                self.process.join(1.0)
+            except (OSError, EOFError):
+                pass
+        self.kill()
+
+    def request(self, kind, payload, timeout):
+        """Mengirim satu permintaan ke worker dan menunggu balasan dengan batas waktu."""
+        self.start()
+        self.conn.send((kind, payload))
+        started = time.monotonic()
+        while not self.conn.poll(self.poll_interval):
+            if self.should_cancel is not None and self.should_cancel():
+                self.kill(); self.interrupted = 'cancelled'
+                raise EvaluationCancelledError("Evaluasi f(x) dibatalkan.")
+            if timeout is not None and time.monotonic() - started > timeout:
+                self.kill(); self.interrupted = 'timed_out'
+                raise EvaluationTimeoutError(f"Evaluasi f({format_float(payload) if kind == 'eval' else '...'}) melebihi batas waktu {format_float(timeout)} detik.")
+            if not self.process.is_alive(): break # Worker mati di tengah jalan, ditangani di bawah
+        try:
+            status, value = self.conn.recv()
+        except (EOFError, OSError): # Worker berhenti tak terduga (misal kehabisan memori)
+            self.kill()
+            raise RuntimeError("Proses worker evaluasi f(x) berhenti tak terduga.")
+        if status == 'err': raise ValueError(value)
+        return value
+
+    def load(self, equation_str, timeout=None):
+        """Menyiapkan persamaan di worker (parsing dilakukan di proses worker)."""
+        self.equation = equation_str
+        if self.loaded_equation == equation_str and self.process is not None and self.process.is_alive(): return
+        self.request('load', equation_str, timeout)
+        self.loaded_equation = equation_str
+
+    def __call__(self, x):
+        if self.equation is None:
+            raise RuntimeError("Belum ada persamaan di worker evaluasi f(x); panggil load() terlebih dahulu.")
+        if self.loaded_equation != self.equation or self.process is None or not self.process.is_alive():
+            self.load(self.equation, timeout=self.eval_timeout) # Proses baru setelah dihentikan paksa: muat ulang persamaan
+        return self.request('eval', x, self.eval_timeout)
+
+def run_solver_with_deadline(solve, equation_str, deadline=None, eval_timeout=None, cancel_event=None, worker=None):
+    """Menjalankan solve(f, should_cancel) dengan batas waktu total, timeout per evaluasi, dan pembatalan.
+    - deadline: batas waktu total (detik) untuk seluruh perhitungan, None = tanpa batas.
+    - eval_timeout: batas waktu satu evaluasi f(x) (detik), None = tanpa batas.
+    - cancel_event: threading.Event; jika di-set, perhitungan berhenti secepatnya.
+    - worker: EvaluationWorker yang dipakai ulang (opsional); jika None dan dibutuhkan, worker dibuat dan ditutup di sini.
+    Worker hanya dipakai jika deadline atau eval_timeout diberikan. Persamaan di-parse di worker
+    (ikut dibatasi deadline), lalu solve menerima worker sebagai f. Tanpa batas waktu, solve menerima
+    f=None (parsing di proses ini) dan hanya pembatalan kooperatif lewat should_cancel yang berlaku.
+    Hasil solve ditandai 'cancelled' / 'timed_out' jika perhitungan berhenti lebih awal.
+    """
+    started = time.monotonic()
+    def deadline_passed():
+        return deadline is not None and time.monotonic() - started > deadline
+    def should_cancel():
+        return (cancel_event is not None and cancel_event.is_set()) or deadline_passed()
+
+    if deadline is None and eval_timeout is None:
+        worker = None
+        result = solve(None, should_cancel)
+    else:
+        own_worker = worker is None
+        if own_worker: worker = EvaluationWorker()
+        worker.eval_timeout = eval_timeout
+        worker.should_cancel = should_cancel
+        worker.interrupted = None
+        try:
+            load_timeout = min(t for t in (eval_timeout, None if deadline is None else max(deadline - (time.monotonic() - started), 0.0)) if t is not None)
+            try:
+                worker.load(equation_str, timeout=load_timeout)
+            except (EvaluationTimeoutError, EvaluationCancelledError):
+                interrupted = 'cancelled' if worker.interrupted == 'cancelled' and not deadline_passed() else 'timed_out'
+                return {'error': "Perhitungan dihentikan saat membaca persamaan (batas waktu tercapai atau dibatalkan).", interrupted: True}
+            except ValueError as e: # Persamaan tidak valid; pesannya sama dengan parse_equation_for_lambdify
+                return {'error': str(e)}
+            except Exception as e_worker: # Misal worker gagal dijalankan
+                return {'error': f"Gagal menyiapkan worker evaluasi f(x): {str(e_worker)}"}
+            result = solve(worker, should_cancel)
+        finally:
+            worker.should_cancel = None
+            if own_worker: worker.close()
+
+    # Tandai penyebab berhenti lebih awal agar pemanggil (GUI/CLI/service) bisa membedakannya
+    if 'error' in result:
+        if deadline_passed():
+            result['timed_out'] = True; result.pop('cancelled', None)
+            result['error'] = f"Batas waktu total ({format_float(deadline)} detik) tercapai.\n{result['error']}"
+        elif cancel_event is not None and cancel_event.is_set():
+            result['cancelled'] = True
+        elif worker is not None and worker.interrupted == 'timed_out': # Satu evaluasi f(x) melebihi eval_timeout
+            result['timed_out'] = True
+    return result
+
+def bisection_method_with_deadline(equation_str, a_str, b_str, tol_str, max_iter_str="100", deadline=None, eval_timeout=None, cancel_event=None, worker=None):
+    """Versi bisection_method dengan batas waktu total, timeout per evaluasi, dan pembatalan (lihat run_solver_with_deadline).
+    Jika worker dipakai, setiap evaluasi f(x) berjalan di worker sehingga evaluasi yang macet bisa dihentikan paksa.
+    Hasil sama dengan bisection_method, ditambah 'cancelled' / 'timed_out' dan data iterasi sementara jika berhenti lebih awal.
+    """
+    def solve(f, should_cancel):
+        return bisection_method(equation_str, a_str, b_str, tol_str, max_iter_str, f=f, should_cancel=should_cancel)
+    return run_solver_with_deadline(solve, equation_str, deadline=deadline, eval_timeout=eval_timeout, cancel_event=cancel_event, worker=worker)
+
+def chebyshev_all_roots_with_deadline(equation_str, a_str, b_str, tol_str="1e-10", deadline=None, cancel_event=None, worker=None):
+    """Versi chebyshev_all_roots dengan batas waktu total dan pembatalan (lihat run_solver_with_deadline).
+    Persamaan divalidasi dulu di worker (parsing yang macet dihentikan paksa oleh deadline). Sampling
+    Chebyshev tetap dilakukan di proses ini karena butuh f(x) versi NumPy, jadi setelah itu deadline dan
+    pembatalan hanya dicek di antara penggandaan derajat dan pemolesan akar.
+    """
+    def solve(f, should_cancel):
+        return chebyshev_all_roots(equation_str, a_str, b_str, tol_str, should_cancel=should_cancel)
+    return run_solver_with_deadline(solve, equation_str, deadline=deadline, cancel_event=cancel_event, worker=worker)
+
+async def bisection_method_async(equation_str, a_str, b_str, tol_str, max_iter_str="100", deadline=None, eval_timeout=None, worker=None):
+    """Versi async dari bisection_method_with_deadline.
+    Perhitungan berjalan di thread executor; jika task asyncio dibatalkan, perhitungan ikut dihentikan
+    (pembatalan diteruskan lewat threading.Event dan evaluasi yang sedang berjalan dihentikan paksa).
+    Jika 'worker' diberikan, jangan memakai worker yang sama di beberapa panggilan async yang berjalan bersamaan;
+    beri setiap task worker sendiri atau biarkan worker=None.
+    """
+    cancel_event = threading.Event()
+    loop = asyncio.get_running_loop()
+    call = functools.partial(bisection_method_with_deadline, equation_str, a_str, b_str, tol_str, max_iter_str,
+                             deadline=deadline, eval_timeout=eval_timeout, cancel_event=cancel_event, worker=worker)
+    try:
+        return await loop.run_in_executor(None, call)
+    except asyncio.CancelledError:
+        cancel_event.set() # Hentikan thread perhitungan di iterasi/evaluasi berikutnya
+        raise
 
 # --- Frontend GUI --- (Bagian kode untuk tampilan antarmuka pengguna)
 class BisectionCalculatorApp(ctk.CTk): # Kelas utama aplikasi, mewarisi dari CTk (CustomTkinter)
@@ -461,6 +1010,16 @@ class BisectionCalculatorApp(ctk.CTk): # Kelas utama aplikasi, mewarisi dari CTk
 
         self.preview_canvas_widget = None # Variabel untuk menyimpan widget kanvas pratinjau Matplotlib
 
+        # --- Pengaturan perhitungan di background --- (agar GUI tetap responsif untuk persamaan yang lambat)
+        self.solve_deadline_s = 60 # Batas waktu total satu perhitungan (detik)
+        self.eval_timeout_s = 10 # Batas waktu satu evaluasi f(x) (detik)
+        self.evaluation_worker = EvaluationWorker() # Worker evaluasi f(x), dipakai ulang antar perhitungan
+        self.cancel_event = None # threading.Event untuk membatalkan perhitungan yang sedang berjalan
+        self.pending_result = None # Hasil dari thread perhitungan, diambil oleh poll_calculation
+        self.pending_result_handler = None # Fungsi yang menampilkan hasil tersebut (show_bisection_result / show_all_roots_result)
+        self.last_solve_inputs = None # (persamaan, a, b) dari perhitungan terakhir, untuk tab grafik
+        self.protocol("WM_DELETE_WINDOW", self.on_close) # Pastikan worker ikut ditutup saat aplikasi ditutup
+
         # --- Input Frame --- (Frame/wadah untuk semua elemen input)
         self.input_frame = ctk.CTkFrame(self, fg_color="transparent") # Buat frame, fg_color="transparent" agar menyatu dengan background app
         self.input_frame.pack(pady=10, padx=20, fill="x") # Tempatkan frame di window (pack layout manager)
@@ -511,11 +1070,27 @@ class BisectionCalculatorApp(ctk.CTk): # Kelas utama aplikasi, mewarisi dari CTk
         instruction_text = ("Format Persamaan:\n- 'x' sebagai variabel.\n- Perkalian implisit: '4x', 'x(x+1)'.\n- Pangkat: 'x^3' atau 'x**3'.\n- Fungsi: sin,cos,tan,exp,log(ln),log10,sqrt,abs,pow.\n- Konstanta: pi, e.")
         ctk.CTkLabel(self.input_frame, text=instruction_text, text_color=self.text_color, justify="left", wraplength=300, font=self.font_instruction_tuple).grid(row=0, column=3, rowspan=input_row_start+3, padx=(20,5), pady=5, sticky="nw") # Teks di sisi kanan input
 
+        # Frame untuk tombol-tombol aksi (Hitung Akar dan Semua Akar)
+        self.action_button_frame = ctk.CTkFrame(self.input_frame, fg_color="transparent")
+        self.action_button_frame.grid(row=input_row_start+3, column=0, columnspan=3, pady=(15,10)) # Tempatkan di bawah input, agak lebar
+
         # Tombol Hitung Akar
-        self.calculate_button = ctk.CTkButton(self.input_frame, text="Hitung Akar", command=self.calculate_root, # Fungsi calculate_root dipanggil saat diklik
+        self.calculate_button = ctk.CTkButton(self.action_button_frame, text="Hitung Akar", command=self.calculate_root, # Fungsi calculate_root dipanggil saat diklik
                                               fg_color=self.button_fg_color, hover_color=self.button_hover_color,
                                               text_color=self.button_text_color, font=self.font_button_tuple, height=35)
-        self.calculate_button.grid(row=input_row_start+3, column=0, columnspan=3, pady=(15,10)) # Tempatkan di bawah input, agak lebar
+        self.calculate_button.pack(side="left", padx=5)
+
+        # Tombol Semua Akar (metode Chebyshev, semua akar di [a,b] sekaligus)
+        self.all_roots_button = ctk.CTkButton(self.action_button_frame, text="Semua Akar (Chebyshev)", command=self.calculate_all_roots,
+                                              fg_color=self.button_fg_color, hover_color=self.button_hover_color,
+                                              text_color=self.button_text_color, font=self.font_button_tuple, height=35)
+        self.all_roots_button.pack(side="left", padx=5)
+
+        # Tombol Batal (aktif hanya selama perhitungan berjalan)
+        self.cancel_button = ctk.CTkButton(self.action_button_frame, text="Batal", command=self.cancel_calculation, state="disabled",
+                                           fg_color=self.clr_dusty_rose, hover_color=self.button_hover_color,
+                                           text_color=self.button_text_color, font=self.font_button_tuple, height=35)
+        self.cancel_button.pack(side="left", padx=5)
         self.input_frame.columnconfigure(1, weight=1) # Kolom kedua (tempat entry) di input_frame bisa expand jika window di-resize
 
         # --- Output Notebook (Tabs) --- (Area output dengan beberapa tab)
@@ -532,6 +1107,7 @@ class BisectionCalculatorApp(ctk.CTk): # Kelas utama aplikasi, mewarisi dari CTk
         self.output_notebook.pack(pady=10, padx=20, fill="both", expand=True) # Tempatkan Tabview, fill="both" dan expand=True agar mengisi sisa ruang
         self.output_notebook.add("Detail Perhitungan Iterasi") # Tambah tab pertama
         self.output_notebook.add("Tabel Ringkasan Iterasi")   # Tambah tab kedua
+        self.output_notebook.add("Grafik f(x)")               # Tambah tab ketiga (grafik dan animasi bracket)
         self.output_notebook.set("Detail Perhitungan Iterasi") # Set tab pertama sebagai default yang aktif
 
         # --- Tab Log Iterasi Detail ---
@@ -596,6 +1172,58 @@ class BisectionCalculatorApp(ctk.CTk): # Kelas utama aplikasi, mewarisi dari CTk
         # Hubungkan scrollbar dengan Treeview
         self.tree.configure(yscrollcommand=tree_scr_y.set, xscrollcommand=tree_scr_x.set)
 
+        # --- Tab Grafik f(x) --- (plot fungsi dan animasi bracket [a, b] per iterasi)
+        plot_frame = self.output_notebook.tab("Grafik f(x)")
+        plot_controls = ctk.CTkFrame(plot_frame, fg_color="transparent")
+        plot_controls.pack(fill="x", padx=5, pady=(5,0))
+        self.play_animation_button = ctk.CTkButton(plot_controls, text="▶ Putar Animasi", width=150, state="disabled",
+                                                   command=self.toggle_bracket_animation, # Putar/jeda animasi bracket
+                                                   fg_color=self.button_fg_color, hover_color=self.button_hover_color,
+                                                   text_color=self.button_text_color, font=self.font_button_tuple)
+        self.play_animation_button.pack(side="left", padx=5)
+        self.plot_status_label = ctk.CTkLabel(plot_controls, text="Hitung akar untuk menampilkan grafik.", text_color=self.text_color, font=self.font_convergence_info_tuple)
+        self.plot_status_label.pack(side="left", padx=10)
+
+        self.plot_fig = Figure(figsize=(8, 3.5), dpi=100, facecolor=self.log_fg_color) # Figure untuk grafik f(x)
+        self.plot_ax = self.plot_fig.add_subplot(111)
+        self.plot_canvas = FigureCanvasTkAgg(self.plot_fig, master=plot_frame)
+        self.plot_toolbar = NavigationToolbar2Tk(self.plot_canvas, plot_frame, pack_toolbar=False) # Toolbar pan/zoom bawaan Matplotlib
+        self.plot_toolbar.update()
+        self.plot_toolbar.pack(side="bottom", fill="x")
+        self.plot_canvas.get_tk_widget().pack(fill="both", expand=True, padx=2, pady=2)
+
+        # Artist statis: kurva f(x), garis y = 0, dan titik akar
+        self.plot_curve_line, = self.plot_ax.plot([], [], color=self.clr_dark_purple, lw=1.5)
+        self.plot_ax.axhline(0, color=self.clr_light_peach_base, lw=1)
+        self.plot_roots_line, = self.plot_ax.plot([], [], 'o', color=self.clr_dusty_rose, ms=6)
+        # Artist animasi: animated=True artinya tidak ikut digambar saat draw biasa, hanya di-blit per frame
+        self.plot_bracket_patch = Rectangle((0, 0), 0, 1, transform=self.plot_ax.get_xaxis_transform(), # x dalam data, y dalam koordinat axes (0..1)
+                                            facecolor=self.clr_golden_yellow, alpha=0.3, animated=True, visible=False)
+        self.plot_ax.add_patch(self.plot_bracket_patch)
+        self.plot_mid_line = self.plot_ax.axvline(0, color=self.clr_dusty_rose, lw=1, ls='--', animated=True, visible=False)
+        self.plot_mid_marker, = self.plot_ax.plot([], [], 'o', color=self.clr_dusty_rose, ms=6, animated=True)
+        self.plot_frame_text = self.plot_ax.text(0.01, 0.97, "", transform=self.plot_ax.transAxes, va='top', ha='left',
+                                                 fontsize=9, color=self.text_color, animated=True)
+        self.plot_animated_artists = [self.plot_bracket_patch, self.plot_mid_line, self.plot_mid_marker, self.plot_frame_text]
+
+        self.plot_background = None # Salinan gambar tanpa artist animasi (untuk blitting)
+        self.plot_equation = None # Persamaan yang sedang digambar
+        self.plot_sample_range = None # Rentang x yang sudah disampel (lebih lebar dari tampilan, agar pan kecil tidak perlu sampel ulang)
+        self.plot_sample_pixels = 0 # Jumlah kolom pixel yang dipakai saat sampling terakhir
+        self.plot_resample_job = None # Job after_idle untuk sampling ulang
+        self.plot_sample_request = None # (persamaan, x_min, x_max, pixel) terbaru yang diminta dari thread sampling
+        self.plot_sample_result = None # (permintaan, (xs, ys) atau Exception) dari thread sampling, diambil oleh poll_plot_samples
+        self.plot_sample_busy = False # True selama thread sampling masih berjalan
+        self.plot_autoscale_bounds = None # (a, b, pad) jika batas y perlu diatur setelah sampel pertama tiba
+        self.plot_frames = [] # Data animasi per iterasi: (n, a, b, c, f(c))
+        self.plot_frame_index = 0
+        self.plot_frame_stride = 1 # Lompatan frame agar durasi animasi tetap wajar untuk ribuan iterasi
+        self.plot_frame_interval_ms = 40 # Jeda antar frame animasi (ms)
+        self.plot_max_playback_ms = 15000 # Durasi maksimum satu kali putar animasi (ms)
+        self.plot_animation_job = None # Job after untuk frame berikutnya
+        self.plot_canvas.mpl_connect('draw_event', self.on_plot_draw)
+        self.plot_ax.callbacks.connect('xlim_changed', self.on_plot_xlim_changed)
+
     def update_equation_preview(self):
         """Fungsi untuk menampilkan pratinjau persamaan matematika menggunakan Matplotlib dan LaTeX."""
         # Hapus pratinjau lama jika ada (widget kanvas Matplotlib)
@@ -655,8 +1283,11 @@ class BisectionCalculatorApp(ctk.CTk): # Kelas utama aplikasi, mewarisi dari CTk
 
     def calculate_root(self):
         """Fungsi utama yang dipanggil saat tombol 'Hitung Akar' ditekan.
-        Mengambil input, memanggil bisection_method, dan menampilkan hasilnya di GUI.
+        Mengambil input dan menjalankan bisection_method_with_deadline di thread background,
+        lalu hasilnya ditampilkan oleh show_bisection_result (lewat poll_calculation).
         """
+        if self.cancel_event is not None: return # Masih ada perhitungan yang berjalan
+
         # Bersihkan output dari perhitungan sebelumnya
         for i in self.tree.get_children(): # Hapus semua baris data di tabel Treeview
             self.tree.delete(i)
@@ -687,9 +1318,58 @@ class BisectionCalculatorApp(ctk.CTk): # Kelas utama aplikasi, mewarisi dari CTk
             self.iteration_log_textbox.configure(state="disabled") # Nonaktifkan lagi textbox log
             return # Hentikan proses kalkulasi
 
-        # Panggil fungsi backend bisection_method dengan input yang sudah diambil
-        result = bisection_method(eq_str, a_s, b_s, tol_s, max_it_s)
-
+        # Jalankan backend di thread terpisah agar GUI tidak membeku; evaluasi f(x) berjalan di worker yang bisa dihentikan paksa
+        self.iteration_log_textbox.configure(state="disabled") # Log diisi lagi setelah hasil tersedia
+        self.last_solve_inputs = (eq_str, a_s, b_s) # Dipakai untuk menggambar grafik setelah hasil tersedia
+        def run_solver(cancel_event):
+            return bisection_method_with_deadline(eq_str, a_s, b_s, tol_s, max_it_s, deadline=self.solve_deadline_s,
+                                                  eval_timeout=self.eval_timeout_s, cancel_event=cancel_event,
+                                                  worker=self.evaluation_worker)
+        self.start_background_calculation(run_solver, self.show_bisection_result)
+
+    def start_background_calculation(self, run_solver, show_result):
+        """Menjalankan run_solver(cancel_event) di thread background (satu perhitungan pada satu waktu),
+        lalu hasilnya diberikan ke show_result di thread Tkinter lewat poll_calculation.
+        """
+        self.cancel_event = threading.Event()
+        self.pending_result = None
+        self.pending_result_handler = show_result
+        self.calculate_button.configure(state="disabled"); self.all_roots_button.configure(state="disabled")
+        self.cancel_button.configure(state="normal")
+        self.result_label.configure(text="Menghitung...")
+        cancel_event = self.cancel_event
+        def run():
+            try:
+                self.pending_result = run_solver(cancel_event)
+            except Exception as e: # Jangan biarkan thread mati tanpa hasil; poll_calculation akan menunggu selamanya
+                self.pending_result = {'error': f"Error tak terduga saat perhitungan: {str(e)}"}
+        threading.Thread(target=run, daemon=True).start()
+        self.after(50, self.poll_calculation) # Cek hasil secara berkala tanpa memblokir event loop Tkinter
+
+    def poll_calculation(self):
+        """Mengecek apakah thread perhitungan sudah selesai; jika belum, cek lagi nanti."""
+        if self.pending_result is None:
+            self.after(50, self.poll_calculation)
+            return
+        result, self.pending_result, self.cancel_event = self.pending_result, None, None
+        self.calculate_button.configure(state="normal"); self.all_roots_button.configure(state="normal")
+        self.cancel_button.configure(state="disabled")
+        self.pending_result_handler(result)
+
+    def cancel_calculation(self):
+        """Fungsi yang dipanggil saat tombol 'Batal' ditekan. Perhitungan berhenti di iterasi/evaluasi berikutnya."""
+        if self.cancel_event is not None: self.cancel_event.set()
+
+    def on_close(self):
+        """Menutup aplikasi: batalkan perhitungan yang berjalan dan hentikan worker evaluasi."""
+        self.cancel_calculation()
+        self.evaluation_worker.kill()
+        self.destroy()
+
+    def show_bisection_result(self, result):
+        """Menampilkan hasil bisection_method (log, tabel ringkasan, dan info konvergensi) di GUI."""
+        self.result_label.configure(text="")
+        self.iteration_log_textbox.configure(state="normal")
         # Tampilkan log iterasi di textbox dan terapkan styling untuk header iterasi
         if 'iteration_log_text' in result: # Cek apakah ada log teks di hasil
             full_log_content = "".join(result['iteration_log_text']) # Gabungkan semua baris log menjadi satu string besar
@@ -720,6 +1400,23 @@ class BisectionCalculatorApp(ctk.CTk): # Kelas utama aplikasi, mewarisi dari CTk
 
         self.iteration_log_textbox.configure(state="disabled") # Nonaktifkan kembali textbox log (read-only)
 
+        # Perhitungan dibatalkan atau melewati batas waktu: tampilkan hasil sementara yang sudah didapat
+        if result.get('cancelled') or result.get('timed_out'):
+            title = "Perhitungan Dibatalkan" if result.get('cancelled') else "Batas Waktu Tercapai"
+            messagebox.showwarning(title, result['error'])
+            estimate_txt = f" Aproksimasi terakhir x = {result['root']}." if result.get('root') else ""
+            self.result_label.configure(text=f"{title}.{estimate_txt}")
+            for row_data in result.get('iterations_data', []):
+                self.tree.insert("", "end", values=(row_data["n"], row_data["a"], row_data["f(a)"], row_data["b"],
+                                                    row_data["f(b)"], row_data["c"], row_data["f(c)"],
+                                                    row_data["Update"], row_data["Abs_Error"], row_data["Rel_Error_Percent"]))
+            # Grafik hanya jika sudah ada iterasi: artinya persamaan sudah berhasil di-parse di worker dalam batas waktu.
+            # Tanpa itu, sampling grafik akan mem-parsing ulang di proses GUI (bisa memegang GIL dan membekukan Tk).
+            if result.get('iteration_values'):
+                self.plot_solver_result(*self.last_solve_inputs, result['iteration_values'], [])
+            self.output_notebook.set("Tabel Ringkasan Iterasi")
+            return
+
         # Tampilkan pesan error dari backend jika ada
         if 'error' in result:
             messagebox.showerror("Error Kalkulasi", result['error'], icon='cancel') # Popup error
@@ -757,8 +1454,234 @@ class BisectionCalculatorApp(ctk.CTk): # Kelas utama aplikasi, mewarisi dari CTk
             self.tree.insert("", "end", values=(row_data["n"], row_data["a"], row_data["f(a)"], row_data["b"],
                                                 row_data["f(b)"], row_data["c"], row_data["f(c)"],
                                                 row_data["Update"], row_data["Abs_Error"], row_data["Rel_Error_Percent"]))
+        self.plot_solver_result(*self.last_solve_inputs, result['iteration_values'], [result['root_value']]) # Perbarui tab grafik
         self.output_notebook.set("Tabel Ringkasan Iterasi") # Pindah fokus ke tab tabel hasil
 
+    def calculate_all_roots(self):
+        """Fungsi yang dipanggil saat tombol 'Semua Akar (Chebyshev)' ditekan.
+        Mencari semua akar di [a,b] dengan chebyshev_all_roots_with_deadline di thread background
+        (bisa dibatalkan dan dibatasi deadline seperti calculate_root), lalu ditampilkan oleh show_all_roots_result.
+        """
+        if self.cancel_event is not None: return # Masih ada perhitungan yang berjalan
+
+        # Bersihkan output dari perhitungan sebelumnya
+        for i in self.tree.get_children():
+            self.tree.delete(i)
+        self.result_label.configure(text="")
+        self.convergence_info_label.configure(text="")
+        self.iteration_log_textbox.configure(state="normal")
+        self.iteration_log_textbox.delete("1.0", ctk.END)
+
+        eq_str = self.equation_entry.get()
+        a_s = self.a_entry.get()
+        b_s = self.b_entry.get()
+        tol_s = self.tol_entry.get()
+
+        # Maks iterasi tidak dipakai di metode ini, jadi tidak wajib diisi
+        if not all([eq_str, a_s, b_s, tol_s]):
+            messagebox.showerror("Input Error", "Persamaan, interval, dan toleransi harus diisi.", icon='warning')
+            self.iteration_log_textbox.configure(state="disabled")
+            return
+
+        self.iteration_log_textbox.configure(state="disabled") # Log diisi lagi setelah hasil tersedia
+        self.last_solve_inputs = (eq_str, a_s, b_s)
+        def run_solver(cancel_event):
+            return chebyshev_all_roots_with_deadline(eq_str, a_s, b_s, tol_s, deadline=self.solve_deadline_s,
+                                                     cancel_event=cancel_event, worker=self.evaluation_worker)
+        self.start_background_calculation(run_solver, self.show_all_roots_result)
+
+    def show_all_roots_result(self, result):
+        """Menampilkan hasil chebyshev_all_roots (log, daftar akar, dan grafik) di GUI."""
+        eq_str, a_s, b_s = self.last_solve_inputs
+        self.result_label.configure(text="")
+        self.iteration_log_textbox.configure(state="normal")
+        if 'iteration_log_text' in result:
+            self.iteration_log_textbox.insert("1.0", "".join(result['iteration_log_text']))
+        self.iteration_log_textbox.configure(state="disabled")
+
+        if result.get('cancelled') or result.get('timed_out'):
+            title = "Perhitungan Dibatalkan" if result.get('cancelled') else "Batas Waktu Tercapai"
+            messagebox.showwarning(title, result['error'])
+            self.result_label.configure(text=f"{title}.")
+            self.output_notebook.set("Detail Perhitungan Iterasi")
+            return
+
+        if 'error' in result:
+            messagebox.showerror("Error Kalkulasi", result['error'], icon='cancel')
+            self.output_notebook.set("Detail Perhitungan Iterasi")
+            return
+
+        self.result_label.configure(text=result['message'])
+        roots_txt = ", ".join(f"x{i+1} = {r}" for i, r in enumerate(result['roots'])) if result['roots'] else "-"
+        self.convergence_info_label.configure(text=f"Akar: {roots_txt}\nToleransi Error (ε) = {format_float(result['tolerance'], 10)}.")
+        self.plot_solver_result(eq_str, a_s, b_s, [], result['root_values']) # Grafik dengan semua akar (tanpa animasi)
+        self.output_notebook.set("Tabel Ringkasan Iterasi")
+
+    def plot_solver_result(self, equation_str, a_str, b_str, iteration_values, roots):
+        """Menggambar f(x) untuk hasil perhitungan: interval diambil dari iterasi pertama (atau input a, b).
+        Hanya dipanggil untuk persamaan yang sudah berhasil di-parse oleh solver (dalam batas waktu), karena
+        sampling grafik mem-parsing persamaan di proses GUI tanpa bisa dihentikan paksa.
+        iteration_values berisi nilai mentah (n, a, b, c, f(c)) dari bisection_method, dipakai langsung sebagai frame animasi.
+        """
+        if iteration_values: a, b = iteration_values[0][1], iteration_values[0][2]
+        else:
+            try:
+                a, b = sorted((evaluate_numeric_input(a_str)[0], evaluate_numeric_input(b_str)[0]))
+            except ValueError: # Interval tidak bisa dibaca, grafik dilewati
+                return
+        self.update_plot(equation_str, a, b, iteration_values, roots)
+
+    def update_plot(self, equation_str, a, b, frames=(), roots=()):
+        """Menampilkan grafik f(x) di [a, b] (plus margin) beserta titik akar, dan menyiapkan frame animasi bracket."""
+        self.stop_bracket_animation()
+        self.plot_equation = equation_str
+        self.plot_frames = list(frames); self.plot_frame_index = 0
+        self.plot_frame_stride = max(1, math.ceil(len(self.plot_frames) * self.plot_frame_interval_ms / self.plot_max_playback_ms))
+        for artist in self.plot_animated_artists: artist.set_visible(False)
+        self.plot_frame_text.set_visible(True); self.plot_frame_text.set_text("")
+
+        pad = 0.05 * (b - a) if b > a else 1.0
+        self.plot_sample_range = None
+        self.plot_ax.set_xlim(a - pad, b + pad)
+        self.plot_roots_line.set_data(list(roots), [0.0] * len(roots))
+        self.plot_ax.set_title(f"f(x) = {equation_str}", fontsize=10, color=self.text_color)
+        self.play_animation_button.configure(state="disabled", text="▶ Putar Animasi")
+        self.plot_status_label.configure(text="Mengambil sampel f(x)...")
+        self.plot_autoscale_bounds = (a, b, pad) # Batas y diatur setelah sampel tiba (lihat finish_plot_update)
+        self.resample_plot(force=True)
+
+    def finish_plot_update(self):
+        """Dipanggil saat sampel pertama untuk update_plot tiba: atur batas y, tombol animasi, dan status."""
+        a, b, pad = self.plot_autoscale_bounds
+        self.plot_autoscale_bounds = None
+        # Batas y dari data di dalam tampilan; persentil dipakai agar asimtot (misal tan) tidak merusak skala
+        xs, ys = self.plot_curve_line.get_data()
+        in_view = numpy.isfinite(ys) & (xs >= a - pad) & (xs <= b + pad)
+        if numpy.any(in_view):
+            y_lo, y_hi = numpy.percentile(ys[in_view], [1, 99])
+            y_lo, y_hi = min(y_lo, 0.0), max(y_hi, 0.0) # Garis y = 0 selalu terlihat
+            y_pad = 0.1 * (y_hi - y_lo) if y_hi > y_lo else 1.0
+            self.plot_ax.set_ylim(y_lo - y_pad, y_hi + y_pad)
+        self.plot_toolbar.update() # Jadikan tampilan ini sebagai 'home' untuk toolbar
+        self.play_animation_button.configure(state="normal" if self.plot_frames else "disabled")
+        if not numpy.any(in_view): status_txt = "f(x) tidak terdefinisi di rentang ini."
+        elif self.plot_frames: status_txt = f"{len(self.plot_frames)} iterasi siap dianimasikan."
+        else: status_txt = ""
+        self.plot_status_label.configure(text=status_txt)
+
+    def resample_plot(self, force=False):
+        """Meminta sampel ulang f(x) hanya jika tampilan keluar dari rentang yang sudah disampel
+        atau resolusinya tidak cukup lagi (misal setelah zoom in/resize).
+        Sampling berjalan di thread background agar persamaan yang lambat tidak membekukan GUI;
+        hasilnya dipasang oleh poll_plot_samples.
+        """
+        self.plot_resample_job = None
+        if self.plot_equation is None: return
+        x0, x1 = self.plot_ax.get_xlim()
+        pixels = int(math.ceil(max(self.plot_ax.bbox.width, 200) / 100) * 100) # Dibulatkan agar kunci cache stabil
+        if not force and self.plot_sample_range is not None:
+            s0, s1 = self.plot_sample_range
+            cols_in_view = self.plot_sample_pixels * (x1 - x0) / (s1 - s0) # Kolom sampel yang jatuh di tampilan
+            if s0 <= x0 and x1 <= s1 and cols_in_view >= pixels / 2: return # Sampel lama masih cukup
+        width = x1 - x0
+        # Sampel 2x lebar tampilan, agar pan kecil tidak perlu sampel ulang
+        self.plot_sample_request = (self.plot_equation, x0 - width / 2, x1 + width / 2, 2 * pixels)
+        if not self.plot_sample_busy: self.start_plot_sampling() # Jika masih sibuk, permintaan terbaru diambil setelah thread selesai
+
+    def start_plot_sampling(self):
+        """Menjalankan sample_function_for_plot untuk permintaan terbaru di thread background."""
+        request = self.plot_sample_request
+        self.plot_sample_busy, self.plot_sample_result = True, None
+        def run_sampling():
+            try:
+                samples = sample_function_for_plot(*request, 300)
+            except Exception as e:
+                samples = e
+            self.plot_sample_result = (request, samples)
+        threading.Thread(target=run_sampling, daemon=True).start()
+        self.after(20, self.poll_plot_samples)
+
+    def poll_plot_samples(self):
+        """Mengecek apakah thread sampling sudah selesai, lalu memasang hasilnya ke kurva."""
+        if self.plot_sample_result is None:
+            self.after(20, self.poll_plot_samples)
+            return
+        (request, samples), self.plot_sample_result = self.plot_sample_result, None
+        self.plot_sample_busy = False
+        if request != self.plot_sample_request: # Sudah ada permintaan yang lebih baru (pan/zoom atau persamaan lain)
+            self.start_plot_sampling()
+            return
+        if isinstance(samples, Exception):
+            self.plot_curve_line.set_data([], []); self.plot_roots_line.set_data([], [])
+            self.plot_status_label.configure(text=f"Grafik tidak bisa dibuat: {str(samples)[:80]}")
+            self.plot_sample_range, self.plot_autoscale_bounds = None, None
+            self.plot_canvas.draw_idle()
+            return
+        _, s0, s1, pixels = request
+        self.plot_curve_line.set_data(*samples)
+        self.plot_sample_range, self.plot_sample_pixels = (s0, s1), pixels
+        if self.plot_autoscale_bounds is not None: self.finish_plot_update()
+        self.plot_canvas.draw_idle()
+
+    def on_plot_xlim_changed(self, ax):
+        """Callback saat sumbu x berubah (pan/zoom). Sampling ulang dijadwalkan dan hanya dilakukan jika perlu."""
+        if self.plot_resample_job is None:
+            self.plot_resample_job = self.after_idle(self.resample_plot)
+
+    def on_plot_draw(self, event):
+        """Callback setelah canvas digambar ulang penuh: simpan background untuk blitting lalu gambar frame animasi saat ini."""
+        self.plot_background = self.plot_canvas.copy_from_bbox(self.plot_ax.bbox)
+        self.draw_animated_artists()
+        if self.plot_sample_range is not None: # Canvas mungkin berubah ukuran; resample_plot yang menentukan perlu tidaknya
+            self.on_plot_xlim_changed(self.plot_ax)
+
+    def draw_animated_artists(self):
+        """Menggambar artist animasi (bracket, titik tengah, teks) di atas background."""
+        for artist in self.plot_animated_artists:
+            self.plot_ax.draw_artist(artist)
+
+    def render_animation_frame(self):
+        """Memperbarui artist animasi ke frame saat ini dan me-blit area axes saja (tanpa menggambar ulang kurva)."""
+        n, a, b, c, f_c = self.plot_frames[self.plot_frame_index]
+        self.plot_bracket_patch.set_x(a); self.plot_bracket_patch.set_width(b - a)
+        self.plot_mid_line.set_xdata([c, c])
+        self.plot_mid_marker.set_data([c], [f_c])
+        self.plot_frame_text.set_text(f"Iterasi {n}: [a, b] = [{format_float(a)}, {format_float(b)}], b - a = {b - a:.2e}, c = {format_float(c)}")
+        for artist in self.plot_animated_artists: artist.set_visible(True)
+        if self.plot_background is None: # Belum pernah digambar penuh (misal tab belum pernah dibuka)
+            self.plot_canvas.draw_idle()
+            return
+        self.plot_canvas.restore_region(self.plot_background)
+        self.draw_animated_artists()
+        self.plot_canvas.blit(self.plot_ax.bbox)
+
+    def toggle_bracket_animation(self):
+        """Fungsi yang dipanggil saat tombol putar/jeda animasi ditekan."""
+        if self.plot_animation_job is not None:
+            self.stop_bracket_animation()
+            return
+        if not self.plot_frames: return
+        if self.plot_frame_index >= len(self.plot_frames) - 1: self.plot_frame_index = 0 # Mulai lagi dari awal
+        self.play_animation_button.configure(text="⏸ Jeda")
+        self.animation_step()
+
+    def animation_step(self):
+        """Menampilkan satu frame animasi lalu menjadwalkan frame berikutnya."""
+        self.plot_animation_job = None
+        self.render_animation_frame()
+        if self.plot_frame_index >= len(self.plot_frames) - 1: # Frame terakhir sudah tampil
+            self.stop_bracket_animation()
+            return
+        self.plot_frame_index = min(self.plot_frame_index + self.plot_frame_stride, len(self.plot_frames) - 1)
+        self.plot_animation_job = self.after(self.plot_frame_interval_ms, self.animation_step)
+
+    def stop_bracket_animation(self):
+        """Menghentikan (jeda) animasi bracket."""
+        if self.plot_animation_job is not None:
+            self.after_cancel(self.plot_animation_job)
+            self.plot_animation_job = None
+        self.play_animation_button.configure(text="▶ Putar Animasi")
+
 # --- Main Program Execution ---
 if __name__ == "__main__": # Blok ini hanya dieksekusi jika script dijalankan secara langsung (bukan diimpor sebagai modul)
     app = BisectionCalculatorApp() # Buat instance (objek) dari aplikasi GUI kita
@@ -0,0 +1,47 @@
+"""Tes untuk solver semua akar (chebyshev_all_roots).
+
+Jalankan dengan: python -m unittest test_all_roots
+"""
+import math
+import unittest
+
+from bisection_calculator import chebyshev_all_roots
+
+class ChebyshevAllRootsTest(unittest.TestCase):
+
+    def test_many_simple_roots(self):
+        result = chebyshev_all_roots("sin(x)", "0", "20", "1e-10")
+        self.assertNotIn('error', result)
+        self.assertEqual(len(result['root_values']), 7) # 0, pi, 2pi, ..., 6pi
+        for k, root in enumerate(result['root_values']):
+            self.assertAlmostEqual(root, k * math.pi, delta=1e-9)
+        self.assertEqual(result['roots'][1], "3.14159265") # Tampilan 8 desimal
+
+    def test_double_root_is_not_moved_by_polishing(self):
+        result = chebyshev_all_roots("(x-0.5)^2", "0", "1", "1e-10")
+        self.assertNotIn('error', result)
+        self.assertEqual(len(result['root_values']), 1)
+        self.assertAlmostEqual(result['root_values'][0], 0.5, delta=1e-7)
+
+    def test_multiple_and_simple_root_together(self):
+        result = chebyshev_all_roots("(x-0.3)^3*(x-0.8)", "0", "1", "1e-10")
+        self.assertEqual(len(result['root_values']), 2)
+        self.assertAlmostEqual(result['root_values'][0], 0.3, delta=1e-5)
+        self.assertAlmostEqual(result['root_values'][1], 0.8, delta=1e-10)
+
+    def test_no_root(self):
+        result = chebyshev_all_roots("x^2 + 1", "-1", "1", "1e-10")
+        self.assertNotIn('error', result)
+        self.assertEqual(result['root_values'], [])
+        self.assertTrue(result['message'].startswith("Tidak ada akar"))
+
+    def test_invalid_interval(self):
+        self.assertIn('error', chebyshev_all_roots("x", "1", "1"))
+        self.assertIn('error', chebyshev_all_roots("x", "abc", "1"))
+
+    def test_cancel(self):
+        result = chebyshev_all_roots("sin(20*x)", "0", "10", "1e-8", should_cancel=lambda: True)
+        self.assertTrue(result.get('cancelled'))
+
+if __name__ == "__main__":
+    unittest.main()
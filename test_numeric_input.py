@@ -0,0 +1,91 @@
+"""Tes untuk evaluator kolom input numerik (evaluate_numeric_input).
+
+Jalankan dengan: python -m unittest test_numeric_input
+"""
+import math
+import unittest
+
+from bisection_calculator import MAX_NUMERIC_INPUT_LENGTH, evaluate_numeric_input
+
+class NumericInputWhitelistTest(unittest.TestCase):
+    """Angka, operator, konstanta, dan fungsi yang diizinkan."""
+
+    def test_numbers_and_operators(self):
+        self.assertEqual(evaluate_numeric_input("1.5")[0], 1.5)
+        self.assertEqual(evaluate_numeric_input("1e-3*2")[0], 0.002)
+        self.assertEqual(evaluate_numeric_input("7-2/4")[0], 6.5)
+        self.assertEqual(evaluate_numeric_input("2^3^2")[0], 512.0) # Pangkat asosiatif kanan
+        self.assertEqual(evaluate_numeric_input("2**10")[0], 1024.0)
+        self.assertEqual(evaluate_numeric_input("-(1+2)")[0], -3.0)
+
+    def test_constants_and_functions(self):
+        self.assertEqual(evaluate_numeric_input("pi/2")[0], math.pi / 2)
+        self.assertEqual(evaluate_numeric_input("E")[0], math.e) # Huruf besar/kecil tidak dibedakan
+        self.assertAlmostEqual(evaluate_numeric_input("sqrt(2)*sqrt(2)")[0], 2.0)
+        self.assertEqual(evaluate_numeric_input("abs(-3)")[0], 3.0)
+        self.assertEqual(evaluate_numeric_input("log10(1000)")[0], 3.0)
+
+    def test_numbers_from_code(self):
+        self.assertEqual(evaluate_numeric_input(5), (5.0, "5"))
+        with self.assertRaises(ValueError): evaluate_numeric_input(float("nan"))
+
+class NumericInputDisplayTest(unittest.TestCase):
+    """Tampilan ekspresi untuk log (superscript dan kurung)."""
+
+    def test_superscript_exponent(self):
+        self.assertEqual(evaluate_numeric_input("10^-5"), (1e-05, "10⁻⁵"))
+        self.assertEqual(evaluate_numeric_input("(1+2)^2"), (9.0, "(1+2)²"))
+
+    def test_expression_kept_as_typed(self):
+        self.assertEqual(evaluate_numeric_input("pi/2")[1], "pi/2")
+        self.assertEqual(evaluate_numeric_input("1e-3*2")[1], "1e-3*2")
+        self.assertEqual(evaluate_numeric_input("sqrt(2)")[1], "sqrt(2)")
+        self.assertEqual(evaluate_numeric_input("1-(2-3)")[1], "1-(2-3)")
+
+class NumericInputRejectionTest(unittest.TestCase):
+    """Input yang harus ditolak dengan ValueError (bukan error lain)."""
+
+    def assertRejected(self, text):
+        with self.assertRaises(ValueError):
+            evaluate_numeric_input(text)
+
+    def test_names_and_calls_outside_whitelist(self):
+        self.assertRejected('__import__("os")')
+        self.assertRejected("x")
+        self.assertRejected("max(1, 2)")
+        self.assertRejected("(1).real")
+        self.assertRejected("sqrt(1, 2)")
+
+    def test_syntax_and_empty(self):
+        self.assertRejected("")
+        self.assertRejected("1+")
+        self.assertRejected("True")
+        self.assertRejected("1j")
+
+    def test_long_and_deeply_nested_input(self):
+        self.assertRejected("1+" * 100000 + "1")
+        self.assertRejected("-" * 100000 + "1")
+        self.assertRejected("1" * (MAX_NUMERIC_INPUT_LENGTH + 1))
+        self.assertRejected("(" * 150 + "1" + ")" * 150)
+
+    def test_complex_results(self):
+        self.assertRejected("(-8)^(1/3)")
+        self.assertRejected("abs((-8)^(1/3))") # Hasil kompleks tidak boleh diubah jadi real oleh abs()
+
+    def test_arithmetic_errors(self):
+        self.assertRejected("1/0")
+        self.assertRejected("10^400")
+        self.assertRejected("exp(1000)")
+        self.assertRejected("sqrt(-1)")
+        self.assertRejected("log(0)")
+
+class NumericInputCacheTest(unittest.TestCase):
+
+    def test_repeated_input_is_cached(self):
+        evaluate_numeric_input("3*pi/4")
+        hits = evaluate_numeric_input.cache_info().hits
+        evaluate_numeric_input("3*pi/4")
+        self.assertEqual(evaluate_numeric_input.cache_info().hits, hits + 1)
+
+if __name__ == "__main__":
+    unittest.main()